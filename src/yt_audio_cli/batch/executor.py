@@ -92,7 +92,7 @@ def reset_shutdown() -> None:
     shutdown_event.clear()
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerState:
     """Current state of a download worker.
 
@@ -209,12 +209,14 @@ class WorkerPool[T]:
         if is_shutdown_requested():
             return None
 
-        # Update worker state
+        self.mark_worker_busy(worker_id, job)
+        return self.submit(fn, job, worker_id, worker_id=worker_id)
+
+    def mark_worker_busy(self, worker_id: int, job: DownloadJob) -> None:
+        """Mark a worker as processing the given job."""
         if worker_id in self.worker_states:
             self.worker_states[worker_id].job = job
 
-        return self.submit(fn, job, worker_id, worker_id=worker_id)
-
     def mark_worker_idle(self, worker_id: int) -> None:
         """Mark a worker as idle after completing a job."""
         if worker_id in self.worker_states:
@@ -18,7 +18,7 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadJob:
     """Single download task in a batch.
 
@@ -94,7 +94,7 @@ class DownloadJob:
         self.error_message = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProgressUpdate:
     """Progress update message from worker to display.
 
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import re
 import threading
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -14,8 +15,20 @@ from yt_audio_cli.batch.job import DownloadJob, JobStatus
 if TYPE_CHECKING:
     pass
 
+# Fast path for the canonical YouTube URL shapes (watch?v= as the first
+# query parameter, youtu.be/ID, /embed/ID and /v/ID). Anything it does
+# not match falls back to the urlparse-based extraction, so results are
+# identical either way.
+_YOUTUBE_ID_PATTERN = re.compile(
+    r"^https?://(?:[a-z0-9-]+\.)*(?:"
+    r"youtube\.com/watch\?v=([A-Za-z0-9_-]{11})(?=[&#]|$)"
+    r"|youtu\.be/([A-Za-z0-9_-]+)$"
+    r"|youtube\.com/(?:embed|v)/([A-Za-z0-9_-]+)(?=/|$)"
+    r")"
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class BatchRequest:
     """Collection of download jobs to process.
 
@@ -125,8 +138,23 @@ class BatchRequest:
         job = DownloadJob(url=url, output_dir=output_dir, format=audio_format)
         self.jobs.append(job)
 
+    def add_jobs(
+        self, urls: Iterable[str], output_dir: Path, audio_format: str = "mp3"
+    ) -> None:
+        """Add a job for each URL sharing one output directory and format.
+
+        Args:
+            urls: URLs to download, in order.
+            output_dir: Output directory.
+            audio_format: Target audio format.
+        """
+        self.jobs.extend(
+            DownloadJob(url=url, output_dir=output_dir, format=audio_format)
+            for url in urls
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Summary of batch processing outcome.
 
@@ -208,11 +236,13 @@ def parse_batch_file(path: Path) -> list[str]:
     if not path.exists():
         raise FileNotFoundError(f"Batch file not found: {path}")
 
-    urls: list[str] = []
-    for line in path.read_text().splitlines():
-        line = line.strip()
-        if line and not line.startswith("#"):
-            urls.append(line)
+    # Stream the file rather than reading it whole and splitting it.
+    with path.open(encoding="utf-8") as f:
+        urls = [
+            line
+            for line in (raw.strip() for raw in f)
+            if line and not line.startswith("#")
+        ]
 
     if not urls:
         raise ValueError(f"Batch file is empty: {path}")
@@ -234,6 +264,10 @@ def normalize_url(url: str) -> str:
     """
     url = url.strip().rstrip("/")
 
+    match = _YOUTUBE_ID_PATTERN.match(url)
+    if match:
+        return f"youtube:{match[1] or match[2] or match[3]}"
+
     try:
         parsed = urlparse(url)
     except Exception:
@@ -293,12 +327,17 @@ def deduplicate_urls(urls: list[str]) -> tuple[list[str], list[str]]:
     unique: list[str] = []
     duplicates: list[str] = []
 
+    # Bound methods hoisted out of the loop; this runs once per URL.
+    seen_add = seen.add
+    unique_append = unique.append
+    normalize = normalize_url
+
     for url in urls:
-        normalized = normalize_url(url)
+        normalized = normalize(url)
         if normalized in seen:
             duplicates.append(url)
         else:
-            seen.add(normalized)
-            unique.append(url)
+            seen_add(normalized)
+            unique_append(url)
 
     return unique, duplicates
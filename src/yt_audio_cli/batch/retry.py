@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import random
+import re
 from dataclasses import dataclass
 
 # Error patterns that indicate transient/retryable failures
@@ -49,6 +51,16 @@ PERMANENT_PATTERNS = frozenset(
     }
 )
 
+# Each pattern set compiled into one alternation, so classifying an error
+# is a single scan instead of one substring search per pattern. Patterns
+# are matched against the lowercased message.
+_RETRYABLE_RE = re.compile("|".join(map(re.escape, sorted(RETRYABLE_PATTERNS))))
+_PERMANENT_RE = re.compile("|".join(map(re.escape, sorted(PERMANENT_PATTERNS))))
+
+# Bound once; random.random() draws from [0, 1) like uniform(0, 1) without
+# the extra arithmetic and per-call attribute lookup
+_random = random.random
+
 
 @dataclass
 class RetryConfig:
@@ -97,7 +109,7 @@ class RetryConfig:
         delay = min(self.base_delay * (2**attempt), self.max_delay)
 
         if self.jitter:
-            delay += random.uniform(0, 1)  # nosec B311 - jitter, not security
+            delay += _random()  # nosec B311 - jitter, not security
 
         return delay
 
@@ -113,6 +125,26 @@ class RetryConfig:
         return attempt < self.max_attempts - 1
 
 
+@functools.lru_cache(maxsize=1024)
+def _classify(error: str) -> tuple[bool, bool]:
+    """Classify an error message as permanent and/or retryable (cached).
+
+    Failed batches tend to repeat the same message (e.g. every dead entry
+    of a playlist), so results are memoized per message.
+
+    Args:
+        error: The non-empty error message to classify.
+
+    Returns:
+        Tuple of (is_permanent, is_retryable). Permanent errors are never
+        retryable.
+    """
+    error_lower = error.lower()
+    if _PERMANENT_RE.search(error_lower):
+        return True, False
+    return False, _RETRYABLE_RE.search(error_lower) is not None
+
+
 def is_retryable_error(error: str) -> bool:
     """Check if an error is retryable (transient).
 
@@ -125,14 +157,7 @@ def is_retryable_error(error: str) -> bool:
     if not error:
         return False
 
-    error_lower = error.lower()
-
-    # First check if it's a permanent error
-    if is_permanent_error(error):
-        return False
-
-    # Check for retryable patterns
-    return any(pattern in error_lower for pattern in RETRYABLE_PATTERNS)
+    return _classify(error)[1]
 
 
 def is_permanent_error(error: str) -> bool:
@@ -147,5 +172,4 @@ def is_permanent_error(error: str) -> bool:
     if not error:
         return False
 
-    error_lower = error.lower()
-    return any(pattern in error_lower for pattern in PERMANENT_PATTERNS)
+    return _classify(error)[0]
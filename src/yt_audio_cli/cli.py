@@ -165,9 +165,20 @@ def _download_audio(url: str, temp_dir: Path) -> DownloadResult:
     """Download audio and return result."""
     with create_download_progress() as progress:
         task_id = progress.add_task("Downloading...", total=None)
+        last_downloaded = 0
 
         def callback(downloaded: int, total: int) -> None:
+            nonlocal last_downloaded
             if total > 0:
+                # Size estimates can undershoot; never run past the total
+                downloaded = min(downloaded, total)
+                if downloaded == total == last_downloaded:
+                    return
+                # Skip sub-0.1% steps; Rich only redraws a few times per second
+                step = downloaded - last_downloaded
+                if 0 <= step < total // 1000 and downloaded < total:
+                    return
+                last_downloaded = downloaded
                 progress.update(task_id, completed=downloaded, total=total)
             else:
                 progress.update(task_id, completed=downloaded)
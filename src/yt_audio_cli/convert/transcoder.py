@@ -18,6 +18,11 @@ logger = logging.getLogger(__name__)
 # Maximum reasonable duration for progress tracking (24 hours in seconds)
 MAX_DURATION_SECONDS = 86400
 
+# Key of the FFmpeg -progress field carrying processed time in microseconds.
+# The progress pipe is read as bytes: the fields are ASCII, so lines that
+# are skipped never pay for decoding.
+_OUT_TIME_PREFIX = b"out_time_ms="
+
 # Codec mapping for audio formats
 _CODEC_MAP = {
     "mp3": "libmp3lame",
@@ -34,6 +39,34 @@ _FORMAT_MAP = {
     "wav": "wav",
 }
 
+# Codec and container arguments per format, prebuilt so each command is
+# assembled by unpacking constant tuples
+_FORMAT_ARGS: dict[str, tuple[str, ...]] = {
+    fmt: ("-c:a", codec, "-f", _FORMAT_MAP[fmt]) for fmt, codec in _CODEC_MAP.items()
+}
+
+# Arguments that stream machine-readable progress to stdout
+_PROGRESS_ARGS = ("-progress", "pipe:1", "-nostats")
+
+
+# Resolved FFmpeg executable, cached after the first successful PATH lookup
+_ffmpeg_path: str | None = None
+
+
+def _find_ffmpeg() -> str | None:
+    """Resolve the FFmpeg executable on PATH.
+
+    A successful lookup is cached for the rest of the process so batch
+    transcodes don't walk PATH once per file. Misses are not cached.
+
+    Returns:
+        Absolute path to FFmpeg, or None if it is not installed.
+    """
+    global _ffmpeg_path
+    if _ffmpeg_path is None:
+        _ffmpeg_path = shutil.which("ffmpeg")
+    return _ffmpeg_path
+
 
 def check_ffmpeg() -> bool:
     """Check if FFmpeg is available on PATH.
@@ -41,11 +74,11 @@ def check_ffmpeg() -> bool:
     Returns:
         True if FFmpeg is available, False otherwise.
     """
-    return shutil.which("ffmpeg") is not None
+    return _find_ffmpeg() is not None
 
 
 def _process_ffmpeg_progress(
-    process: subprocess.Popen[str],
+    process: subprocess.Popen[bytes],
     callback: Callable[[float], None],
 ) -> None:
     """Parse FFmpeg progress output and invoke callback.
@@ -61,18 +94,17 @@ def _process_ffmpeg_progress(
         return
 
     for line in process.stdout:
-        line = line.strip()
-        if line.startswith("out_time_ms="):
-            try:
-                microseconds = int(line.split("=")[1])
-                if microseconds < 0:
-                    continue
-                seconds = microseconds / 1_000_000
-                if seconds > MAX_DURATION_SECONDS:
-                    continue
-                callback(seconds)
-            except (ValueError, IndexError, OverflowError):
-                pass
+        if not line.startswith(_OUT_TIME_PREFIX):
+            continue
+        # int() accepts ASCII bytes and ignores the trailing newline
+        try:
+            microseconds = int(line[len(_OUT_TIME_PREFIX) :])
+        except ValueError:
+            continue
+        # Range-check in integer space so huge values never reach float division
+        if not 0 <= microseconds <= MAX_DURATION_SECONDS * 1_000_000:
+            continue
+        callback(microseconds / 1_000_000)
 
 
 def _build_ffmpeg_command(
@@ -82,26 +114,21 @@ def _build_ffmpeg_command(
     bitrate: int | None,
     metadata: dict[str, str] | None,
     with_progress: bool,
+    ffmpeg: str = "ffmpeg",
 ) -> list[str]:
     """Build FFmpeg command for transcoding."""
-    cmd = ["ffmpeg", "-y"]
-
-    if with_progress:
-        cmd.extend(["-progress", "pipe:1", "-nostats"])
-
-    cmd.extend(["-i", str(input_path)])
-
-    codec = _CODEC_MAP.get(audio_format)
-    if codec:
-        cmd.extend(["-c:a", codec])
+    cmd = [
+        ffmpeg,
+        "-y",
+        *(_PROGRESS_ARGS if with_progress else ()),
+        "-i",
+        str(input_path),
+        *_FORMAT_ARGS.get(audio_format, ()),
+    ]
 
     if bitrate and audio_format != "wav":
         cmd.extend(["-b:a", f"{bitrate}k"])
 
-    output_format = _FORMAT_MAP.get(audio_format)
-    if output_format:
-        cmd.extend(["-f", output_format])
-
     if metadata:
         for key, value in metadata.items():
             if value:
@@ -123,11 +150,12 @@ def _run_with_progress(
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
     ) as process:
         _process_ffmpeg_progress(process, callback)
         process.wait()
-        stderr = process.stderr.read() if process.stderr else ""
+        stderr = (
+            process.stderr.read().decode(errors="replace") if process.stderr else ""
+        )
         if process.returncode != 0:
             raise ConversionError(str(input_path), stderr or "Unknown error")
 
@@ -172,7 +200,9 @@ def transcode(
         FFmpegNotFoundError: If FFmpeg is not installed.
         ConversionError: If transcoding fails.
     """
-    if not check_ffmpeg():
+    global _ffmpeg_path
+    ffmpeg = _find_ffmpeg()
+    if ffmpeg is None:
         raise FFmpegNotFoundError
 
     effective_metadata = metadata if embed_metadata else None
@@ -185,6 +215,7 @@ def transcode(
         bitrate=bitrate,
         metadata=effective_metadata,
         with_progress=progress_callback is not None,
+        ffmpeg=ffmpeg,
     )
 
     try:
@@ -195,6 +226,8 @@ def transcode(
         return True
 
     except FileNotFoundError as e:
+        # FFmpeg vanished since it was cached; look it up again next time
+        _ffmpeg_path = None
         raise FFmpegNotFoundError from e
     except subprocess.SubprocessError as e:
         raise ConversionError(str(input_path), str(e)) from e
@@ -1,6 +1,10 @@
 """Download feature - handles yt-dlp interaction for audio downloads."""
 
-from yt_audio_cli.download.batch import BatchDownloader, download_batch
+from yt_audio_cli.download.batch import (
+    BatchDownloader,
+    ProgressSink,
+    download_batch,
+)
 from yt_audio_cli.download.downloader import (
     DownloadResult,
     PlaylistEntry,
@@ -15,6 +19,7 @@ __all__ = [
     "BatchDownloader",
     "DownloadResult",
     "PlaylistEntry",
+    "ProgressSink",
     "download",
     "download_batch",
     "extract_metadata",
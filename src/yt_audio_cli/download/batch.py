@@ -6,12 +6,17 @@ import contextlib
 import tempfile
 import threading
 import time
+from concurrent.futures import Future, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from queue import Queue
-from typing import TYPE_CHECKING
-
-from yt_audio_cli.batch.executor import WorkerPool, is_shutdown_requested
+from queue import Empty, SimpleQueue
+from typing import TYPE_CHECKING, Protocol
+
+from yt_audio_cli.batch.executor import (
+    WorkerPool,
+    is_shutdown_requested,
+    shutdown_event,
+)
 from yt_audio_cli.batch.job import DownloadJob, JobStatus, ProgressUpdate
 from yt_audio_cli.batch.request import BatchRequest, BatchResult
 from yt_audio_cli.batch.retry import RetryConfig, is_permanent_error, is_retryable_error
@@ -22,6 +27,24 @@ from yt_audio_cli.download.downloader import DownloadResult, download
 if TYPE_CHECKING:
     pass
 
+# How long run() blocks waiting for a job before re-checking for shutdown
+_SHUTDOWN_POLL_INTERVAL = 0.1
+
+# Minimum seconds between "progress" events sent for a single job
+_PROGRESS_INTERVAL = 0.1
+
+
+class ProgressSink(Protocol):
+    """Destination for progress updates, such as a queue.Queue.
+
+    Workers call put() from their own threads, so implementations must be
+    safe to call concurrently.
+    """
+
+    def put(self, item: ProgressUpdate, /) -> None:
+        """Accept a progress update."""
+        ...
+
 
 @dataclass
 class BatchDownloader:
@@ -37,7 +60,7 @@ class BatchDownloader:
         bitrate: Target bitrate in kbps.
         embed_metadata: Whether to embed metadata.
         retry_config: Retry configuration for failed downloads.
-        progress_queue: Optional queue for progress updates.
+        progress_queue: Optional sink (e.g. a Queue) for progress updates.
     """
 
     request: BatchRequest
@@ -46,7 +69,7 @@ class BatchDownloader:
     bitrate: int | None = None
     embed_metadata: bool = True
     retry_config: RetryConfig = field(default_factory=RetryConfig)
-    progress_queue: Queue[ProgressUpdate] | None = None
+    progress_queue: ProgressSink | None = None
     _rename_lock: threading.Lock = field(
         default_factory=threading.Lock, init=False, repr=False
     )
@@ -100,10 +123,25 @@ class BatchDownloader:
             temp_dir = Path(temp_dir_str)
 
             # Download phase
+            last_sent = float("-inf")
+            reported_complete = False
+
             def progress_callback(downloaded: int, total: int) -> None:
+                nonlocal last_sent, reported_complete
                 if total > 0:
-                    percent = int((downloaded / total) * 100)
+                    # Size estimates can undershoot; never report past 100
+                    percent = min(int((downloaded / total) * 100), 100)
+                    # yt-dlp reports many times per percent; only emit changes
+                    if percent == job.current_percent:
+                        return
                     job.update_progress(percent)
+                    # Throttle queue traffic, but report completion immediately
+                    first_complete = percent == 100 and not reported_complete
+                    now = time.monotonic()
+                    if not first_complete and now - last_sent < _PROGRESS_INTERVAL:
+                        return
+                    reported_complete = reported_complete or first_complete
+                    last_sent = now
                     self._send_progress(worker_id, job, "progress", percent)
 
             try:
@@ -233,6 +271,10 @@ class BatchDownloader:
             if success:
                 return JobStatus.COMPLETE
 
+            # Shutdown may have cancelled the job between download and conversion
+            if job.status == JobStatus.CANCELLED:
+                return JobStatus.CANCELLED
+
             # Check if we should retry
             error = job.error_message or ""
 
@@ -248,13 +290,55 @@ class BatchDownloader:
             if not self.retry_config.should_retry(attempt):
                 return JobStatus.FAILED
 
-            # Wait before retry
+            # Wait before retry, waking early if shutdown is requested
             delay = self.retry_config.delay_for_attempt(attempt)
-            time.sleep(delay)
+            if shutdown_event.wait(delay):
+                job.mark_cancelled()
+                return JobStatus.CANCELLED
             job.increment_retry()
 
         return JobStatus.FAILED
 
+    def _drain_jobs(
+        self,
+        jobs: SimpleQueue[DownloadJob],
+        pool: WorkerPool[None],
+        worker_id: int,
+    ) -> None:
+        """Process queued jobs on one worker until none are left.
+
+        Args:
+            jobs: Shared queue of jobs still to be processed.
+            pool: Worker pool tracking per-worker state.
+            worker_id: ID of the worker running this loop.
+        """
+        while not is_shutdown_requested():
+            try:
+                job = jobs.get_nowait()
+            except Empty:
+                return
+
+            pool.mark_worker_busy(worker_id, job)
+            try:
+                self._record_status(self._process_job_with_retry(job, worker_id))
+            except Exception:
+                self.request.increment_failed()
+            finally:
+                pool.mark_worker_idle(worker_id)
+
+    def _record_status(self, status: JobStatus) -> None:
+        """Update the request counters for a finished job.
+
+        Args:
+            status: Final status returned by the job.
+        """
+        if status == JobStatus.COMPLETE:
+            self.request.increment_completed()
+        elif status == JobStatus.CANCELLED:
+            self.request.increment_cancelled()
+        else:
+            self.request.increment_failed()
+
     def run(self) -> BatchResult:
         """Execute the batch download.
 
@@ -275,60 +359,21 @@ class BatchDownloader:
         # Limit workers to number of jobs
         effective_workers = min(self.request.max_workers, len(self.request.jobs))
 
-        with WorkerPool[JobStatus](max_workers=effective_workers) as pool:
-            job_index = 0
-            pending_futures: dict[object, tuple[DownloadJob, int]] = {}
+        # Queue every job up front; each worker pulls until the queue is empty
+        jobs: SimpleQueue[DownloadJob] = SimpleQueue()
+        for job in self.request.jobs:
+            jobs.put(job)
 
-            # Submit initial batch of jobs
+        with WorkerPool[None](max_workers=effective_workers) as pool:
+            pending: set[Future[None]] = set()
             for worker_id in range(effective_workers):
-                if job_index < len(self.request.jobs):
-                    job = self.request.jobs[job_index]
-                    future = pool.submit_job(
-                        job, self._process_job_with_retry, worker_id
-                    )
-                    if future:
-                        pending_futures[future] = (job, worker_id)
-                    job_index += 1
+                future = pool.submit(self._drain_jobs, jobs, pool, worker_id)
+                if future:
+                    pending.add(future)
 
-            # Process as jobs complete
-            while pending_futures:
-                if is_shutdown_requested():
-                    break
-
-                # Wait for any future to complete
-                done_futures = []
-                for future in list(pending_futures.keys()):
-                    if future.done():  # type: ignore[union-attr]
-                        done_futures.append(future)
-
-                if not done_futures:
-                    time.sleep(0.01)
-                    continue
-
-                for future in done_futures:
-                    job, worker_id = pending_futures.pop(future)
-                    pool.mark_worker_idle(worker_id)
-
-                    try:
-                        status = future.result()  # type: ignore[union-attr]
-                        if status == JobStatus.COMPLETE:
-                            self.request.increment_completed()
-                        elif status == JobStatus.CANCELLED:
-                            self.request.increment_cancelled()
-                        else:
-                            self.request.increment_failed()
-                    except Exception:
-                        self.request.increment_failed()
-
-                    # Submit next job if available
-                    if job_index < len(self.request.jobs):
-                        next_job = self.request.jobs[job_index]
-                        next_future = pool.submit_job(
-                            next_job, self._process_job_with_retry, worker_id
-                        )
-                        if next_future:
-                            pending_futures[next_future] = (next_job, worker_id)
-                        job_index += 1
+            # The timeout keeps shutdown responsive while workers are busy
+            while pending and not is_shutdown_requested():
+                _, pending = wait(pending, timeout=_SHUTDOWN_POLL_INTERVAL)
 
         return BatchResult.from_request(self.request)
 
@@ -341,7 +386,7 @@ def download_batch(
     max_retries: int = 3,
     bitrate: int | None = None,
     embed_metadata: bool = True,
-    progress_queue: Queue[ProgressUpdate] | None = None,
+    progress_queue: ProgressSink | None = None,
 ) -> BatchResult:
     """Download multiple URLs in parallel.
 
@@ -355,14 +400,13 @@ def download_batch(
         max_retries: Maximum retry attempts per job.
         bitrate: Target bitrate in kbps.
         embed_metadata: Whether to embed metadata.
-        progress_queue: Optional queue for progress updates.
+        progress_queue: Optional sink (e.g. a Queue) for progress updates.
 
     Returns:
         BatchResult with summary of the operation.
     """
     request = BatchRequest(max_workers=max_workers, max_retries=max_retries)
-    for url in urls:
-        request.add_job(url, output_dir, audio_format)
+    request.add_jobs(urls, output_dir, audio_format)
 
     retry_config = RetryConfig(max_attempts=max_retries + 1)
 
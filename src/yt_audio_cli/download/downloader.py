@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import parse_qs, urlparse
 
@@ -19,6 +21,46 @@ logger = logging.getLogger(__name__)
 # Maximum reasonable file size (10TB) for validation
 MAX_FILE_SIZE = 10 * 1024 * 1024 * 1024 * 1024
 
+# Maximum reasonable media duration (24 hours in seconds)
+MAX_DURATION = 86400
+
+# Output filename template, relative to the download directory
+_OUTPUT_TEMPLATE = "%(id)s.%(ext)s"
+
+# Placeholder path for failed results (Path is immutable, so one is shared)
+_EMPTY_PATH = Path()
+
+# Static YoutubeDL options, built once at import. YoutubeDL keeps a reference
+# to the params dict it receives and mutates it, so always pass a copy.
+_BASE_YDL_OPTS = MappingProxyType(
+    {
+        "quiet": True,
+        "no_warnings": True,
+        "no_color": True,
+    }
+)
+_FLAT_PLAYLIST_YDL_OPTS = MappingProxyType(
+    {
+        **_BASE_YDL_OPTS,
+        "extract_flat": "in_playlist",
+        "skip_download": True,
+    }
+)
+_METADATA_YDL_OPTS = MappingProxyType(
+    {
+        **_BASE_YDL_OPTS,
+        "skip_download": True,
+        "noplaylist": True,
+    }
+)
+_DOWNLOAD_YDL_OPTS = MappingProxyType(
+    {
+        **_BASE_YDL_OPTS,
+        "format": "bestaudio/best",
+        "noplaylist": True,
+    }
+)
+
 
 @dataclass
 class DownloadResult:
@@ -68,6 +110,16 @@ def is_playlist(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
 
+    # Every playlist form needs one of these markers; skip parsing otherwise
+    if "list=" not in url and "/playlist" not in url:
+        return False
+
+    return _is_playlist_url(url)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_playlist_url(url: str) -> bool:
+    """Parse a candidate URL and check it for playlist markers (cached)."""
     try:
         parsed = urlparse(url)
     except (ValueError, AttributeError):
@@ -127,7 +179,7 @@ def _create_error_result(url: str, error: str) -> DownloadResult:
         url=url,
         title="",
         artist="",
-        temp_path=Path(),
+        temp_path=_EMPTY_PATH,
         duration=None,
         success=False,
         error=error,
@@ -143,15 +195,20 @@ def _safe_parse_duration(duration_value: float | int | str | None) -> float | No
     Returns:
         Duration as float, or None if parsing fails.
     """
-    if duration_value is None:
+    result: float | int
+    if isinstance(duration_value, float | int):
+        result = duration_value
+    elif duration_value is None:
         return None
-    try:
-        result = float(duration_value)
-        if result < 0 or result > 86400:
+    else:
+        try:
+            result = float(duration_value)
+        except (ValueError, TypeError, OverflowError):
             return None
-        return result
-    except (ValueError, TypeError, OverflowError):
+
+    if not 0 <= result <= MAX_DURATION:
         return None
+    return float(result)
 
 
 def _clean_error_message(error: str | Exception) -> str:
@@ -159,30 +216,21 @@ def _clean_error_message(error: str | Exception) -> str:
 
     Standardizes error message extraction to show only the first relevant line.
     """
-    error_str = str(error)
-    if not error_str or not error_str.strip():
-        return "Unknown error"
-
-    error_msg = error_str.strip()
+    error_msg = str(error)
 
-    if "ERROR:" in error_msg:
-        error_msg = error_msg.split("ERROR:")[-1].strip()
+    # Keep only what follows the last "ERROR:" marker, if any
+    _, marker, tail = error_msg.rpartition("ERROR:")
+    if marker:
+        error_msg = tail
 
-    first_line = error_msg.split("\n")[0].strip()
+    first_line = error_msg.lstrip().partition("\n")[0].rstrip()
+    if not first_line:
+        return "Unknown error"
 
     if len(first_line) > 200:
         first_line = first_line[:197] + "..."
 
-    return first_line if first_line else "Unknown error"
-
-
-def _get_base_ydl_opts() -> dict[str, Any]:
-    """Get base YoutubeDL options."""
-    return {
-        "quiet": True,
-        "no_warnings": True,
-        "no_color": True,
-    }
+    return first_line
 
 
 def extract_playlist(url: str) -> list[str]:
@@ -197,42 +245,7 @@ def extract_playlist(url: str) -> list[str]:
         List of video URLs in the playlist. Empty list if not a playlist
         or if extraction fails.
     """
-    ydl_opts = {
-        **_get_base_ydl_opts(),
-        "extract_flat": "in_playlist",
-        "skip_download": True,
-    }
-
-    try:
-        with YoutubeDL(cast(Any, ydl_opts)) as ydl:
-            info = ydl.extract_info(url, download=False)
-
-            if info is None:
-                return []
-
-            # Check if it's a playlist with entries
-            entries = info.get("entries")
-            if entries is None:
-                return []
-
-            urls: list[str] = []
-            for entry in entries:
-                if entry is None:
-                    continue
-
-                # Skip single video results
-                if entry.get("_type") == "video":
-                    continue
-
-                # Extract URL from entry
-                entry_url = entry.get("url") or entry.get("webpage_url", "")
-                if entry_url:
-                    urls.append(entry_url)
-
-            return urls
-
-    except Exception:
-        return []
+    return [entry.url for entry in extract_playlist_with_metadata(url)]
 
 
 def extract_playlist_with_metadata(url: str) -> list[PlaylistEntry]:
@@ -247,11 +260,7 @@ def extract_playlist_with_metadata(url: str) -> list[PlaylistEntry]:
     Returns:
         List of PlaylistEntry with url and title. Empty list if extraction fails.
     """
-    ydl_opts = {
-        **_get_base_ydl_opts(),
-        "extract_flat": "in_playlist",
-        "skip_download": True,
-    }
+    ydl_opts = dict(_FLAT_PLAYLIST_YDL_OPTS)
 
     try:
         with YoutubeDL(cast(Any, ydl_opts)) as ydl:
@@ -294,11 +303,7 @@ def extract_metadata(url: str) -> dict[str, Any] | None:
     Returns:
         Dictionary with title, uploader/channel, duration, or None if failed.
     """
-    ydl_opts = {
-        **_get_base_ydl_opts(),
-        "skip_download": True,
-        "noplaylist": True,
-    }
+    ydl_opts = dict(_METADATA_YDL_OPTS)
 
     try:
         with YoutubeDL(cast(Any, ydl_opts)) as ydl:
@@ -335,27 +340,29 @@ def download(
         output_dir = Path(tempfile.gettempdir())
 
     ydl_opts = {
-        **_get_base_ydl_opts(),
-        "format": "bestaudio/best",
-        "outtmpl": str(output_dir / "%(id)s.%(ext)s"),
-        "noplaylist": True,
+        **_DOWNLOAD_YDL_OPTS,
+        "outtmpl": str(output_dir / _OUTPUT_TEMPLATE),
         "progress_hooks": [_create_progress_hook(progress_callback)],
     }
 
     try:
         with YoutubeDL(cast(Any, ydl_opts)) as ydl:
-            raw_info = ydl.extract_info(url, download=True)
+            info = ydl.extract_info(url, download=True)
 
-            if raw_info is None:
+            if info is None:
                 return _create_error_result(url, "Failed to extract video info")
 
-            info = cast(dict[str, Any], ydl.sanitize_info(raw_info))
+            # Only a handful of top-level fields are needed, so read them straight
+            # from the info dict instead of deep-copying it with sanitize_info().
+            get = info.get
+            title = get("title", "Unknown")
+            artist = get("uploader") or get("channel") or "Unknown"
+            duration = get("duration")
+            requested_downloads = get("requested_downloads")
 
             # Get the downloaded file path with defensive checks
             temp_path: Path | None = None
-            requested_downloads = info.get("requested_downloads")
-
-            if isinstance(requested_downloads, list) and len(requested_downloads) > 0:
+            if isinstance(requested_downloads, list) and requested_downloads:
                 first_download = requested_downloads[0]
                 if isinstance(first_download, dict):
                     filepath = first_download.get("filepath")
@@ -364,16 +371,14 @@ def download(
 
             # Fallback: construct path from template
             if temp_path is None:
-                video_id = str(info.get("id", "unknown"))
-                ext = str(info.get("ext", "webm"))
-                temp_path = output_dir / f"{video_id}.{ext}"
+                temp_path = output_dir / f"{get('id', 'unknown')}.{get('ext', 'webm')}"
 
             return DownloadResult(
                 url=url,
-                title=str(info.get("title", "Unknown")),
-                artist=str(info.get("uploader") or info.get("channel") or "Unknown"),
+                title=str(title),
+                artist=str(artist),
                 temp_path=temp_path,
-                duration=_safe_parse_duration(info.get("duration")),
+                duration=_safe_parse_duration(duration),
                 success=True,
                 error=None,
             )
@@ -2,11 +2,11 @@
 
 from yt_audio_cli.ui.progress import (
     TimeProgressColumn,
-    console,
     create_batch_progress,
     create_conversion_progress,
     create_download_progress,
     create_progress,
+    get_console,
     print_error,
     print_info,
     print_success,
@@ -21,9 +21,17 @@ __all__ = [
     "create_conversion_progress",
     "create_download_progress",
     "create_progress",
+    "get_console",
     "print_error",
     "print_info",
     "print_success",
     "print_warning",
     "update_download",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Resolve ``console`` lazily so importing the package stays cheap."""
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import functools
+import threading
+
 from rich.console import Console
 from rich.progress import (
     BarColumn,
@@ -18,13 +21,59 @@ from rich.progress import (
 )
 from rich.text import Text
 
-# Global console instance for consistent output
-console = Console()
+# Serializes first-use creation so worker threads share one Console
+_console_lock = threading.Lock()
+
+
+def get_console() -> Console:
+    """Return the shared console, creating it on first use.
+
+    Rich probes the terminal when a Console is constructed, so this is
+    deferred until something is actually printed; early exits such as
+    ``--help`` never pay for it. The instance is stored as the module
+    attribute ``console`` so it can still be imported or patched by name.
+    Messages are printed as pre-styled Text, so the per-print highlighter
+    and emoji passes are disabled.
+
+    Returns:
+        The process-wide Console instance.
+    """
+    module_globals = globals()
+    shared = module_globals.get("console")
+    if shared is None:
+        with _console_lock:
+            shared = module_globals.get("console")
+            if shared is None:
+                shared = Console(highlight=False, emoji=False)
+                module_globals["console"] = shared
+    return shared
+
+
+def __getattr__(name: str) -> Console:
+    """Create the shared ``console`` lazily on first attribute access."""
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Common progress format strings
 _TASK_DESCRIPTION_FORMAT = "[bold blue]{task.description}"
 
 
+@functools.lru_cache(maxsize=4096)
+def _format_seconds(total_secs: int) -> str:
+    """Format whole seconds as M:SS or H:MM:SS (cached).
+
+    Rendering repeats the same second many times per refresh cycle, and
+    the total duration never changes, so results are memoized.
+    """
+    minutes, secs = divmod(total_secs, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
 class TimeProgressColumn(ProgressColumn):
     """Display time progress as elapsed / total (e.g., '0:45 / 3:20').
 
@@ -60,12 +109,7 @@ class TimeProgressColumn(ProgressColumn):
         Returns:
             Formatted time string.
         """
-        total_secs = int(seconds)
-        minutes, secs = divmod(total_secs, 60)
-        hours, minutes = divmod(minutes, 60)
-        if hours:
-            return f"{hours}:{minutes:02d}:{secs:02d}"
-        return f"{minutes}:{secs:02d}"
+        return _format_seconds(int(seconds))
 
 
 def create_progress() -> Progress:
@@ -77,16 +121,7 @@ def create_progress() -> Progress:
     Note:
         Deprecated. Use create_download_progress() or create_conversion_progress().
     """
-    return Progress(
-        SpinnerColumn(),
-        TextColumn(_TASK_DESCRIPTION_FORMAT),
-        BarColumn(),
-        DownloadColumn(),
-        TransferSpeedColumn(),
-        TimeRemainingColumn(),
-        console=console,
-        transient=True,
-    )
+    return create_download_progress()
 
 
 def create_download_progress() -> Progress:
@@ -105,7 +140,7 @@ def create_download_progress() -> Progress:
         DownloadColumn(),
         TransferSpeedColumn(),
         TimeRemainingColumn(),
-        console=console,
+        console=get_console(),
         transient=True,
     )
 
@@ -125,7 +160,7 @@ def create_conversion_progress() -> Progress:
         BarColumn(),
         TimeProgressColumn(),
         TaskProgressColumn(),
-        console=console,
+        console=get_console(),
         transient=True,
     )
 
@@ -142,7 +177,7 @@ def create_batch_progress() -> Progress:
         BarColumn(),
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         TextColumn("({task.completed}/{task.total})"),
-        console=console,
+        console=get_console(),
         transient=False,
     )
 
@@ -164,13 +199,34 @@ def update_download(
     progress.update(task_id, completed=downloaded, total=total)
 
 
+# Pre-styled status prefixes, built once. Text.__add__ returns a new Text,
+# so the shared prefixes are never mutated by printing.
+_PREFIXES = {
+    "success": Text.assemble(("✓", "green"), " "),
+    "error": Text.assemble(("✗", "red"), " "),
+    "warning": Text.assemble(("!", "yellow"), " "),
+    "info": Text.assemble(("→", "blue"), " "),
+}
+
+
+def _print(kind: str, message: str, style: str | None = None) -> None:
+    """Print a message behind the status prefix for ``kind``.
+
+    Args:
+        kind: Key into the prefix table (success, error, warning, info).
+        message: The message to print, rendered literally.
+        style: Optional style applied to the whole line.
+    """
+    get_console().print(_PREFIXES[kind] + message, style=style)
+
+
 def print_success(message: str) -> None:
     """Print a success message.
 
     Args:
         message: The message to print.
     """
-    console.print(f"[green]✓[/green] {message}")
+    _print("success", message)
 
 
 def print_error(message: str) -> None:
@@ -179,7 +235,7 @@ def print_error(message: str) -> None:
     Args:
         message: The message to print.
     """
-    console.print(f"[red]✗[/red] {message}", style="red")
+    _print("error", message, style="red")
 
 
 def print_warning(message: str) -> None:
@@ -188,7 +244,7 @@ def print_warning(message: str) -> None:
     Args:
         message: The message to print.
     """
-    console.print(f"[yellow]![/yellow] {message}", style="yellow")
+    _print("warning", message, style="yellow")
 
 
 def print_info(message: str) -> None:
@@ -197,4 +253,4 @@ def print_info(message: str) -> None:
     Args:
         message: The message to print.
     """
-    console.print(f"[blue]→[/blue] {message}")
+    _print("info", message)
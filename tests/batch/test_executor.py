@@ -24,11 +24,11 @@ class TestWorkerState:
         assert state.is_idle is True
         assert "Idle" in state.display_line
 
-    def test_active_worker(self, temp_dir: Path) -> None:
+    def test_active_worker(self, shared_tmp: Path) -> None:
         """Test active worker with a job."""
         job = DownloadJob(
             url="https://youtube.com/watch?v=test",
-            output_dir=temp_dir,
+            output_dir=shared_tmp,
         )
         job.current_title = "Test Video Title"
         job.current_percent = 50
@@ -38,11 +38,11 @@ class TestWorkerState:
         assert "50%" in state.display_line
         assert "Test Video" in state.display_line
 
-    def test_display_line_truncates_title(self, temp_dir: Path) -> None:
+    def test_display_line_truncates_title(self, shared_tmp: Path) -> None:
         """Test that long titles are truncated in display line."""
         job = DownloadJob(
             url="https://youtube.com/watch?v=test",
-            output_dir=temp_dir,
+            output_dir=shared_tmp,
         )
         job.current_title = "A" * 100  # Very long title
         job.current_percent = 25
@@ -83,11 +83,11 @@ class TestWorkerPool:
             assert result == 10
             assert 5 in results
 
-    def test_submit_job(self, temp_dir: Path) -> None:
+    def test_submit_job(self, shared_tmp: Path) -> None:
         """Test submitting a download job."""
         job = DownloadJob(
             url="https://youtube.com/watch?v=test",
-            output_dir=temp_dir,
+            output_dir=shared_tmp,
         )
 
         def process_job(j: DownloadJob, worker_id: int) -> str:
@@ -100,11 +100,11 @@ class TestWorkerPool:
             assert "Processed" in result
             assert "worker 0" in result
 
-    def test_worker_state_tracking(self, temp_dir: Path) -> None:
+    def test_worker_state_tracking(self, shared_tmp: Path) -> None:
         """Test that worker state is tracked correctly."""
         job = DownloadJob(
             url="https://youtube.com/watch?v=test",
-            output_dir=temp_dir,
+            output_dir=shared_tmp,
         )
 
         def slow_task(_j: DownloadJob, _worker_id: int) -> str:
@@ -129,6 +129,20 @@ class TestWorkerPool:
             pool.mark_worker_idle(0)
             assert pool.worker_states[0].is_idle
 
+    def test_mark_worker_busy(self, shared_tmp: Path) -> None:
+        """Test marking a worker busy without submitting through the pool."""
+        job = DownloadJob(
+            url="https://youtube.com/watch?v=test",
+            output_dir=shared_tmp,
+        )
+
+        pool = WorkerPool[str](max_workers=2)
+        pool.mark_worker_busy(1, job)
+        pool.mark_worker_busy(5, job)
+
+        assert pool.worker_states[1].job == job
+        assert pool.get_idle_workers() == [0]
+
     def test_parallel_execution(self) -> None:
         """Test that tasks run in parallel."""
         start_times: dict[int, float] = {}
@@ -213,7 +227,7 @@ class TestWorkerPool:
             future = pool.submit(lambda x: x, 1)
             assert future is None
 
-    def test_get_active_and_idle_workers(self, temp_dir: Path) -> None:
+    def test_get_active_and_idle_workers(self, shared_tmp: Path) -> None:
         """Test getting lists of active and idle workers."""
         with WorkerPool[str](max_workers=4) as pool:
             # Initially all idle
@@ -223,7 +237,7 @@ class TestWorkerPool:
             # Simulate job assignment
             job = DownloadJob(
                 url="https://youtube.com/watch?v=test",
-                output_dir=temp_dir,
+                output_dir=shared_tmp,
             )
             pool.worker_states[0].job = job
             pool.worker_states[1].job = job
@@ -12,15 +12,15 @@ from yt_audio_cli.batch.job import DownloadJob, JobStatus, ProgressUpdate
 class TestDownloadJob:
     """Tests for DownloadJob dataclass."""
 
-    def test_create_valid_job(self, temp_dir: Path) -> None:
+    def test_create_valid_job(self, shared_tmp: Path) -> None:
         """Test creating a valid download job."""
         job = DownloadJob(
             url="https://youtube.com/watch?v=test123",
-            output_dir=temp_dir,
+            output_dir=shared_tmp,
             format="mp3",
         )
         assert job.url == "https://youtube.com/watch?v=test123"
-        assert job.output_dir == temp_dir
+        assert job.output_dir == shared_tmp
         assert job.format == "mp3"
         assert job.status == JobStatus.PENDING
         assert job.retry_count == 0
@@ -29,87 +29,87 @@ class TestDownloadJob:
         assert job.current_percent == 0
         assert job.current_title == ""
 
-    def test_invalid_url_raises(self, temp_dir: Path) -> None:
+    def test_invalid_url_raises(self, shared_tmp: Path) -> None:
         """Test that invalid URL raises ValueError."""
         with pytest.raises(ValueError, match="Invalid URL"):
             DownloadJob(
                 url="not-a-valid-url",
-                output_dir=temp_dir,
+                output_dir=shared_tmp,
             )
 
-    def test_negative_retry_count_raises(self, temp_dir: Path) -> None:
+    def test_negative_retry_count_raises(self, shared_tmp: Path) -> None:
         """Test that negative retry count raises ValueError."""
         with pytest.raises(ValueError, match="retry_count must be >= 0"):
             DownloadJob(
                 url="https://youtube.com/watch?v=test",
-                output_dir=temp_dir,
+                output_dir=shared_tmp,
                 retry_count=-1,
             )
 
-    def test_percent_clamped_to_valid_range(self, temp_dir: Path) -> None:
+    def test_percent_clamped_to_valid_range(self, shared_tmp: Path) -> None:
         """Test that percent is clamped to 0-100 range."""
         job = DownloadJob(
             url="https://youtube.com/watch?v=test",
-            output_dir=temp_dir,
+            output_dir=shared_tmp,
             current_percent=150,
         )
         assert job.current_percent == 100
 
         job2 = DownloadJob(
             url="https://youtube.com/watch?v=test",
-            output_dir=temp_dir,
+            output_dir=shared_tmp,
             current_percent=-10,
         )
         assert job2.current_percent == 0
 
-    def test_mark_active(self, temp_dir: Path) -> None:
+    def test_mark_active(self, shared_tmp: Path) -> None:
         """Test marking job as active."""
         job = DownloadJob(
             url="https://youtube.com/watch?v=test",
-            output_dir=temp_dir,
+            output_dir=shared_tmp,
         )
         job.mark_active(title="Test Video")
         assert job.status == JobStatus.ACTIVE
         assert job.current_percent == 0
         assert job.current_title == "Test Video"
 
-    def test_mark_complete(self, temp_dir: Path) -> None:
+    def test_mark_complete(self, shared_tmp: Path) -> None:
         """Test marking job as complete."""
         job = DownloadJob(
             url="https://youtube.com/watch?v=test",
-            output_dir=temp_dir,
+            output_dir=shared_tmp,
         )
-        output_path = temp_dir / "test.mp3"
+        output_path = shared_tmp / "test.mp3"
         job.mark_complete(output_path)
         assert job.status == JobStatus.COMPLETE
         assert job.output_path == output_path
         assert job.current_percent == 100
         assert job.error_message is None
 
-    def test_mark_failed(self, temp_dir: Path) -> None:
+    def test_mark_failed(self, shared_tmp: Path) -> None:
         """Test marking job as failed."""
         job = DownloadJob(
             url="https://youtube.com/watch?v=test",
-            output_dir=temp_dir,
+            output_dir=shared_tmp,
         )
         job.mark_failed("Connection timeout")
         assert job.status == JobStatus.FAILED
         assert job.error_message == "Connection timeout"
 
-    def test_mark_cancelled(self, temp_dir: Path) -> None:
+    def test_mark_cancelled(self, shared_tmp: Path) -> None:
         """Test marking job as cancelled."""
         job = DownloadJob(
             url="https://youtube.com/watch?v=test",
-            output_dir=temp_dir,
+            output_dir=shared_tmp,
         )
         job.mark_cancelled()
         assert job.status == JobStatus.CANCELLED
 
-    def test_update_progress(self, temp_dir: Path) -> None:
+    def test_update_progress(self, shared_tmp: Path) -> None:
         """Test updating progress."""
         job = DownloadJob(
             url="https://youtube.com/watch?v=test",
-            output_dir=temp_dir,
+            output_dir=shared_tmp,
         )
         job.update_progress(50, "Downloading...")
         assert job.current_percent == 50
@@ -122,11 +122,11 @@ class TestDownloadJob:
         job.update_progress(-10)
         assert job.current_percent == 0
 
-    def test_increment_retry(self, temp_dir: Path) -> None:
+    def test_increment_retry(self, shared_tmp: Path) -> None:
         """Test incrementing retry count."""
         job = DownloadJob(
             url="https://youtube.com/watch?v=test",
-            output_dir=temp_dir,
+            output_dir=shared_tmp,
         )
         job.mark_failed("Error")
         job.increment_retry()
@@ -29,11 +29,11 @@ class TestBatchRequest:
         assert request.max_workers == 4
         assert request.max_retries == 3
 
-    def test_create_request_with_jobs(self, temp_dir: Path) -> None:
+    def test_create_request_with_jobs(self, shared_tmp: Path) -> None:
         """Test creating a request with jobs."""
         jobs = [
-            DownloadJob(url="https://youtube.com/watch?v=test1", output_dir=temp_dir),
-            DownloadJob(url="https://youtube.com/watch?v=test2", output_dir=temp_dir),
+            DownloadJob(url="https://youtube.com/watch?v=test1", output_dir=shared_tmp),
+            DownloadJob(url="https://youtube.com/watch?v=test2", output_dir=shared_tmp),
         ]
         request = BatchRequest(jobs=jobs, max_workers=8)
         assert request.total == 2
@@ -60,10 +60,10 @@ class TestBatchRequest:
         with pytest.raises(ValueError, match="max_retries must be <= 10"):
             BatchRequest(max_retries=11)
 
-    def test_thread_safe_counters(self, temp_dir: Path) -> None:
+    def test_thread_safe_counters(self, shared_tmp: Path) -> None:
         """Test that counters are thread-safe."""
         request = BatchRequest()
-        request.add_job("https://youtube.com/watch?v=test", temp_dir)
+        request.add_job("https://youtube.com/watch?v=test", shared_tmp)
 
         request.increment_completed()
         assert request.completed == 1
@@ -71,20 +71,31 @@ class TestBatchRequest:
         request.increment_failed()
         assert request.failed == 1
 
-    def test_add_job(self, temp_dir: Path) -> None:
+    def test_add_job(self, shared_tmp: Path) -> None:
         """Test adding a job to the request."""
         request = BatchRequest()
-        request.add_job("https://youtube.com/watch?v=test", temp_dir, "opus")
+        request.add_job("https://youtube.com/watch?v=test", shared_tmp, "opus")
 
         assert request.total == 1
         assert request.jobs[0].url == "https://youtube.com/watch?v=test"
         assert request.jobs[0].format == "opus"
 
-    def test_pending_jobs_iterator(self, temp_dir: Path) -> None:
+    def test_add_jobs(self, shared_tmp: Path) -> None:
+        """Test adding several jobs in one call keeps their order."""
+        urls = [f"https://youtube.com/watch?v=test{i}" for i in range(3)]
+        request = BatchRequest()
+        request.add_jobs(iter(urls), shared_tmp, "opus")
+
+        assert request.total == 3
+        assert [job.url for job in request.jobs] == urls
+        assert all(job.format == "opus" for job in request.jobs)
+        assert all(job.output_dir == shared_tmp for job in request.jobs)
+
+    def test_pending_jobs_iterator(self, shared_tmp: Path) -> None:
         """Test iterating over pending jobs."""
         jobs = [
-            DownloadJob(url="https://youtube.com/watch?v=test1", output_dir=temp_dir),
-            DownloadJob(url="https://youtube.com/watch?v=test2", output_dir=temp_dir),
+            DownloadJob(url="https://youtube.com/watch?v=test1", output_dir=shared_tmp),
+            DownloadJob(url="https://youtube.com/watch?v=test2", output_dir=shared_tmp),
         ]
         jobs[0].status = JobStatus.COMPLETE
         request = BatchRequest(jobs=jobs)
@@ -93,13 +104,13 @@ class TestBatchRequest:
         assert len(pending) == 1
         assert pending[0].url == "https://youtube.com/watch?v=test2"
 
-    def test_pending_jobs_includes_retryable_failed(self, temp_dir: Path) -> None:
+    def test_pending_jobs_includes_retryable_failed(self, shared_tmp: Path) -> None:
         """Test that failed jobs with retries remaining are included.
 
         Note: pending_jobs() is a pure iterator that doesn't modify job status.
         It yields failed jobs that are eligible for retry.
         """
-        job = DownloadJob(url="https://youtube.com/watch?v=test", output_dir=temp_dir)
+        job = DownloadJob(url="https://youtube.com/watch?v=test", output_dir=shared_tmp)
         job.mark_failed("Timeout")
         request = BatchRequest(jobs=[job], max_retries=3)
 
@@ -108,9 +119,9 @@ class TestBatchRequest:
         # Status remains FAILED - iterator doesn't mutate jobs
         assert pending[0].status == JobStatus.FAILED
 
-    def test_pending_jobs_excludes_exhausted_retries(self, temp_dir: Path) -> None:
+    def test_pending_jobs_excludes_exhausted_retries(self, shared_tmp: Path) -> None:
         """Test that failed jobs with exhausted retries are excluded."""
-        job = DownloadJob(url="https://youtube.com/watch?v=test", output_dir=temp_dir)
+        job = DownloadJob(url="https://youtube.com/watch?v=test", output_dir=shared_tmp)
         job.mark_failed("Timeout")
         job.retry_count = 3
         request = BatchRequest(jobs=[job], max_retries=3)
@@ -122,14 +133,14 @@ class TestBatchRequest:
 class TestBatchResult:
     """Tests for BatchResult dataclass."""
 
-    def test_create_result(self, temp_dir: Path) -> None:
+    def test_create_result(self, shared_tmp: Path) -> None:
         """Test creating a batch result."""
         result = BatchResult(
             total=10,
             successful=8,
             failed=2,
             skipped_duplicates=1,
-            successful_files=[temp_dir / "test.mp3"],
+            successful_files=[shared_tmp / "test.mp3"],
         )
         assert result.total == 10
         assert result.successful == 8
@@ -158,13 +169,13 @@ class TestBatchResult:
         )
         assert result_without_failures.has_failures is False
 
-    def test_from_request(self, temp_dir: Path) -> None:
+    def test_from_request(self, shared_tmp: Path) -> None:
         """Test creating result from a completed request."""
         jobs = [
-            DownloadJob(url="https://youtube.com/watch?v=test1", output_dir=temp_dir),
-            DownloadJob(url="https://youtube.com/watch?v=test2", output_dir=temp_dir),
+            DownloadJob(url="https://youtube.com/watch?v=test1", output_dir=shared_tmp),
+            DownloadJob(url="https://youtube.com/watch?v=test2", output_dir=shared_tmp),
         ]
-        jobs[0].mark_complete(temp_dir / "test1.mp3")
+        jobs[0].mark_complete(shared_tmp / "test1.mp3")
         jobs[1].mark_failed("Error")
 
         request = BatchRequest(jobs=jobs)
@@ -181,9 +192,9 @@ class TestBatchResult:
 class TestParseBatchFile:
     """Tests for parse_batch_file function."""
 
-    def test_parse_valid_file(self, temp_dir: Path) -> None:
+    def test_parse_valid_file(self, tmp_path: Path) -> None:
         """Test parsing a valid batch file."""
-        batch_file = temp_dir / "urls.txt"
+        batch_file = tmp_path / "urls.txt"
         batch_file.write_text(
             """# This is a comment
 https://youtube.com/watch?v=test1
@@ -200,22 +211,22 @@ https://youtube.com/watch?v=test3
         assert urls[1] == "https://youtube.com/watch?v=test2"
         assert urls[2] == "https://youtube.com/watch?v=test3"
 
-    def test_parse_file_not_found(self, temp_dir: Path) -> None:
+    def test_parse_file_not_found(self, tmp_path: Path) -> None:
         """Test that missing file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError, match="Batch file not found"):
-            parse_batch_file(temp_dir / "nonexistent.txt")
+            parse_batch_file(tmp_path / "nonexistent.txt")
 
-    def test_parse_empty_file(self, temp_dir: Path) -> None:
+    def test_parse_empty_file(self, tmp_path: Path) -> None:
         """Test that empty file raises ValueError."""
-        batch_file = temp_dir / "empty.txt"
+        batch_file = tmp_path / "empty.txt"
         batch_file.write_text("")
 
         with pytest.raises(ValueError, match="Batch file is empty"):
             parse_batch_file(batch_file)
 
-    def test_parse_comments_only_file(self, temp_dir: Path) -> None:
+    def test_parse_comments_only_file(self, tmp_path: Path) -> None:
         """Test that file with only comments raises ValueError."""
-        batch_file = temp_dir / "comments.txt"
+        batch_file = tmp_path / "comments.txt"
         batch_file.write_text("# Just a comment\n# Another comment\n")
 
         with pytest.raises(ValueError, match="Batch file is empty"):
@@ -250,6 +261,35 @@ class TestNormalizeUrl:
         url = "https://vimeo.com/12345"
         assert normalize_url(url) == "https://vimeo.com/12345"
 
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://youtu.be/dQw4w9WgXcQ", "youtube:dQw4w9WgXcQ"),
+            ("https://youtu.be/dQw4w9WgXcQ?t=42", "youtube:dQw4w9WgXcQ"),
+            ("https://m.youtube.com/watch?v=dQw4w9WgXcQ&t=1", "youtube:dQw4w9WgXcQ"),
+            (
+                "https://music.youtube.com/watch?v=dQw4w9WgXcQ&list=RDAMVM",
+                "youtube:dQw4w9WgXcQ",
+            ),
+            (
+                "https://www.youtube.com/watch?list=PL123&v=dQw4w9WgXcQ",
+                "youtube:dQw4w9WgXcQ",
+            ),
+            ("https://WWW.YOUTUBE.COM/watch?v=dQw4w9WgXcQ", "youtube:dQw4w9WgXcQ"),
+            ("https://www.youtube.com/embed/dQw4w9WgXcQ", "youtube:dQw4w9WgXcQ"),
+            ("https://m.youtube.com/v/dQw4w9WgXcQ/extra", "youtube:dQw4w9WgXcQ"),
+            ("https://www.youtube.com/watch?v=short", "youtube:short"),
+            (
+                "https://youtu.be/dQw4w9WgXcQ/extra",
+                "https://youtu.be/dQw4w9WgXcQ/extra",
+            ),
+            ("youtube.com/watch?v=dQw4w9WgXcQ", "youtube.com/watch?v=dQw4w9WgXcQ"),
+        ],
+    )
+    def test_normalize_url_variants(self, url: str, expected: str) -> None:
+        """Test canonical forms for URLs on and off the regex fast path."""
+        assert normalize_url(url) == expected
+
 
 class TestDeduplicateUrls:
     """Tests for deduplicate_urls function."""
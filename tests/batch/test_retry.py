@@ -74,6 +74,14 @@ class TestRetryConfig:
         # Base delay is 1.0, jitter adds 0-1, so delay should be 1.0-2.0
         assert 1.0 <= delay <= 2.0
 
+    def test_delay_tracks_field_changes(self) -> None:
+        """Test delays follow the config after its fields are reassigned."""
+        config = RetryConfig(base_delay=1.0, max_delay=30.0, jitter=False)
+        assert config.delay_for_attempt(1) == 2.0
+
+        config.base_delay = 3.0
+        assert config.delay_for_attempt(1) == 6.0
+
     def test_delay_for_negative_attempt(self) -> None:
         """Test that negative attempt number is treated as 0."""
         config = RetryConfig(base_delay=1.0, jitter=False)
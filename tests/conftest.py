@@ -2,22 +2,23 @@
 
 from __future__ import annotations
 
-import tempfile
 from pathlib import Path
-from typing import TYPE_CHECKING
-from unittest.mock import MagicMock
 
 import pytest
 
-if TYPE_CHECKING:
-    from collections.abc import Generator
 
+@pytest.fixture(scope="module")
+def input_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create an empty input media file shared by a test module."""
+    input_path = tmp_path_factory.mktemp("input") / "input.webm"
+    input_path.touch()
+    return input_path
 
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for test outputs."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a session-wide directory for tests that never write to it."""
+    return tmp_path_factory.mktemp("shared")
 
 
 @pytest.fixture
@@ -62,23 +63,3 @@ def mock_yt_dlp_playlist() -> dict:
             },
         ],
     }
-
-
-@pytest.fixture
-def mock_subprocess_success() -> MagicMock:
-    """Mock subprocess.run for successful command execution."""
-    mock = MagicMock()
-    mock.returncode = 0
-    mock.stdout = ""
-    mock.stderr = ""
-    return mock
-
-
-@pytest.fixture
-def mock_subprocess_failure() -> MagicMock:
-    """Mock subprocess.run for failed command execution."""
-    mock = MagicMock()
-    mock.returncode = 1
-    mock.stdout = ""
-    mock.stderr = "Error: Command failed"
-    return mock
@@ -73,40 +73,40 @@ class TestSanitize:
 class TestResolveConflict:
     """Tests for resolve_conflict() function."""
 
-    def test_no_conflict(self, temp_dir: Path) -> None:
+    def test_no_conflict(self, tmp_path: Path) -> None:
         """Test when file doesn't exist."""
-        path = temp_dir / "test.mp3"
+        path = tmp_path / "test.mp3"
         assert resolve_conflict(path) == path
 
-    def test_single_conflict(self, temp_dir: Path) -> None:
+    def test_single_conflict(self, tmp_path: Path) -> None:
         """Test resolving a single conflict."""
-        path = temp_dir / "test.mp3"
+        path = tmp_path / "test.mp3"
         path.touch()
 
         result = resolve_conflict(path)
-        assert result == temp_dir / "test (1).mp3"
+        assert result == tmp_path / "test (1).mp3"
 
-    def test_multiple_conflicts(self, temp_dir: Path) -> None:
+    def test_multiple_conflicts(self, tmp_path: Path) -> None:
         """Test resolving multiple conflicts."""
-        base_path = temp_dir / "test.mp3"
+        base_path = tmp_path / "test.mp3"
         base_path.touch()
-        (temp_dir / "test (1).mp3").touch()
-        (temp_dir / "test (2).mp3").touch()
+        (tmp_path / "test (1).mp3").touch()
+        (tmp_path / "test (2).mp3").touch()
 
         result = resolve_conflict(base_path)
-        assert result == temp_dir / "test (3).mp3"
+        assert result == tmp_path / "test (3).mp3"
 
-    def test_preserves_extension(self, temp_dir: Path) -> None:
+    def test_preserves_extension(self, tmp_path: Path) -> None:
         """Test that extension is preserved."""
-        path = temp_dir / "song.opus"
+        path = tmp_path / "song.opus"
         path.touch()
 
         result = resolve_conflict(path)
         assert result.suffix == ".opus"
 
-    def test_different_extensions_no_conflict(self, temp_dir: Path) -> None:
+    def test_different_extensions_no_conflict(self, tmp_path: Path) -> None:
         """Test that different extensions don't conflict."""
-        (temp_dir / "test.mp3").touch()
-        path = temp_dir / "test.wav"
+        (tmp_path / "test.mp3").touch()
+        path = tmp_path / "test.wav"
 
         assert resolve_conflict(path) == path
@@ -0,0 +1,58 @@
+"""Shared fixtures for download tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from yt_audio_cli.download import batch
+
+
+class Stub:
+    """Plain callable stand-in for download/transcode that records its calls.
+
+    Attributes:
+        result: Value to return, exception to raise, or callable to
+            delegate to with the call's arguments.
+        calls: Positional and keyword arguments of every call, in order.
+    """
+
+    def __init__(self, result: Any = None) -> None:
+        self.result = result
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        if isinstance(self.result, BaseException):
+            raise self.result
+        if callable(self.result):
+            return self.result(*args, **kwargs)
+        return self.result
+
+
+@pytest.fixture
+def make_download_stub(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[..., Stub]:
+    """Install a Stub in place of a function imported by the batch module."""
+
+    def install(name: str, result: Any = None) -> Stub:
+        stub = Stub(result)
+        monkeypatch.setattr(batch, name, stub)
+        return stub
+
+    return install
+
+
+@pytest.fixture
+def download_stub(make_download_stub: Callable[..., Stub]) -> Stub:
+    """Replace the downloader used by BatchDownloader."""
+    return make_download_stub("download")
+
+
+@pytest.fixture
+def transcode_stub(make_download_stub: Callable[..., Stub]) -> Stub:
+    """Replace the transcoder used by BatchDownloader."""
+    return make_download_stub("transcode", True)
@@ -2,19 +2,42 @@
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import replace
 from pathlib import Path
-from queue import Queue
-from unittest.mock import MagicMock, patch
 
 import pytest
 
+from yt_audio_cli.batch import executor
 from yt_audio_cli.batch.executor import reset_shutdown, shutdown_event
-from yt_audio_cli.batch.job import ProgressUpdate
+from yt_audio_cli.batch.job import JobStatus, ProgressUpdate
 from yt_audio_cli.batch.request import BatchRequest
 from yt_audio_cli.batch.retry import RetryConfig
+from yt_audio_cli.download import batch
 from yt_audio_cli.download.batch import BatchDownloader, download_batch
 from yt_audio_cli.download.downloader import DownloadResult
 
+from .conftest import Stub
+
+_SUCCESS_RESULT = DownloadResult(
+    url="",
+    title="Test Video",
+    artist="Test Artist",
+    temp_path=Path(),
+    duration=120.0,
+    success=True,
+)
+_FAILURE_RESULT = DownloadResult(
+    url="",
+    title="",
+    artist="",
+    temp_path=Path(),
+    duration=None,
+    success=False,
+    error="Video unavailable",
+)
+
 
 @pytest.fixture(autouse=True)
 def reset_shutdown_state() -> None:
@@ -22,15 +45,89 @@ def reset_shutdown_state() -> None:
     reset_shutdown()
 
 
+class _ImmediateExecutor:
+    """ThreadPoolExecutor stand-in that runs each task in the calling thread."""
+
+    def __init__(self, *_args, **_kwargs) -> None:
+        pass
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, *_args, **_kwargs) -> None:
+        pass
+
+
+@pytest.fixture
+def immediate_executor(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run WorkerPool tasks inline instead of on worker threads."""
+    monkeypatch.setattr(executor, "ThreadPoolExecutor", _ImmediateExecutor)
+
+
+class _UnusedWorkerPool:
+    """WorkerPool stand-in that fails the test if a pool is created."""
+
+    def __class_getitem__(cls, _item):
+        return cls
+
+    def __init__(self, *_args, **_kwargs) -> None:
+        raise AssertionError("WorkerPool should not be created")
+
+
+class _ProgressRecorder:
+    """Lock-free progress sink that keeps every update in arrival order."""
+
+    def __init__(self) -> None:
+        self.items: deque[ProgressUpdate] = deque()
+
+    def put(self, item: ProgressUpdate) -> None:
+        self.items.append(item)
+
+
+def _write_converted(*args, **kwargs) -> bool:
+    """Stand in for transcode by writing a fake converted output file."""
+    output_path = args[1] if len(args) > 1 else kwargs.get("output_path")
+    if output_path:
+        output_path.write_bytes(b"converted audio")
+    return True
+
+
+def _make_download_side_effect(input_path: Path):
+    """Build a download stand-in returning a uniquely titled result per call."""
+    call_count = 0
+
+    def create_download_result(**kwargs):
+        nonlocal call_count
+        call_count += 1
+        return DownloadResult(
+            url=kwargs.get("url"),
+            title=f"Test Video {call_count}",
+            artist="Test Artist",
+            temp_path=input_path,
+            duration=120.0,
+            success=True,
+        )
+
+    return create_download_result
+
+
 class TestBatchDownloader:
     """Tests for BatchDownloader class."""
 
-    def test_empty_request(self, temp_dir: Path) -> None:
-        """Test processing an empty batch request."""
+    def test_empty_request(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test an empty batch returns without starting a worker pool."""
+        monkeypatch.setattr(batch, "WorkerPool", _UnusedWorkerPool)
         request = BatchRequest()
         downloader = BatchDownloader(
             request=request,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
         )
 
         result = downloader.run()
@@ -38,74 +135,51 @@ class TestBatchDownloader:
         assert result.successful == 0
         assert result.failed == 0
 
-    @patch("yt_audio_cli.download.batch.download")
-    @patch("yt_audio_cli.download.batch.transcode")
     def test_successful_download(
         self,
-        mock_transcode: MagicMock,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        transcode_stub: Stub,
+        download_stub: Stub,
+        input_file: Path,
+        tmp_path: Path,
     ) -> None:
         """Test successful download and conversion."""
-        # Create temp file to simulate download
-        temp_audio = temp_dir / "temp_audio.webm"
-        temp_audio.write_bytes(b"fake audio data")
-
-        mock_download.return_value = DownloadResult(
+        download_stub.result = replace(
+            _SUCCESS_RESULT,
             url="https://youtube.com/watch?v=test",
-            title="Test Video",
-            artist="Test Artist",
-            temp_path=temp_audio,
-            duration=120.0,
-            success=True,
+            temp_path=input_file,
         )
-        mock_transcode.return_value = True
 
         request = BatchRequest(max_workers=1)
-        request.add_job("https://youtube.com/watch?v=test", temp_dir)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
 
         downloader = BatchDownloader(
             request=request,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
         )
 
-        # Create output file to simulate conversion
-        def create_output(*args, **kwargs):
-            output_path = args[1] if len(args) > 1 else kwargs.get("output_path")
-            if output_path:
-                output_path.write_bytes(b"converted audio")
-            return True
-
-        mock_transcode.side_effect = create_output
+        transcode_stub.result = _write_converted
 
         result = downloader.run()
         assert result.total == 1
         assert result.successful == 1
         assert result.failed == 0
 
-    @patch("yt_audio_cli.download.batch.download")
     def test_failed_download(
         self,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        download_stub: Stub,
+        tmp_path: Path,
     ) -> None:
         """Test handling of failed download."""
-        mock_download.return_value = DownloadResult(
-            url="https://youtube.com/watch?v=test",
-            title="",
-            artist="",
-            temp_path=Path(),
-            duration=None,
-            success=False,
-            error="Video unavailable",
+        download_stub.result = replace(
+            _FAILURE_RESULT, url="https://youtube.com/watch?v=test"
         )
 
         request = BatchRequest(max_workers=1)
-        request.add_job("https://youtube.com/watch?v=test", temp_dir)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
 
         downloader = BatchDownloader(
             request=request,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
         )
 
         result = downloader.run()
@@ -114,17 +188,14 @@ class TestBatchDownloader:
         assert result.failed == 1
         assert len(result.failed_jobs) == 1
 
-    @patch("yt_audio_cli.download.batch.download")
-    @patch("yt_audio_cli.download.batch.transcode")
     def test_progress_updates(
         self,
-        mock_transcode: MagicMock,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        transcode_stub: Stub,
+        download_stub: Stub,
+        input_file: Path,
+        tmp_path: Path,
     ) -> None:
         """Test that progress updates are sent to queue."""
-        temp_audio = temp_dir / "temp_audio.webm"
-        temp_audio.write_bytes(b"fake audio data")
 
         def download_with_progress(**kwargs):
             url = kwargs.get("url")
@@ -133,32 +204,23 @@ class TestBatchDownloader:
             if progress_callback:
                 progress_callback(50, 100)
                 progress_callback(100, 100)
-            return DownloadResult(
+            return replace(
+                _SUCCESS_RESULT,
                 url=url,
-                title="Test Video",
-                artist="Test Artist",
-                temp_path=temp_audio,
-                duration=120.0,
-                success=True,
+                temp_path=input_file,
             )
 
-        mock_download.side_effect = download_with_progress
+        download_stub.result = download_with_progress
 
-        def create_output(*args, **kwargs):
-            output_path = args[1] if len(args) > 1 else kwargs.get("output_path")
-            if output_path:
-                output_path.write_bytes(b"converted audio")
-            return True
-
-        mock_transcode.side_effect = create_output
+        transcode_stub.result = _write_converted
 
-        progress_queue: Queue[ProgressUpdate] = Queue()
+        progress_queue = _ProgressRecorder()
         request = BatchRequest(max_workers=1)
-        request.add_job("https://youtube.com/watch?v=test", temp_dir)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
 
         downloader = BatchDownloader(
             request=request,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
             progress_queue=progress_queue,
         )
 
@@ -166,59 +228,122 @@ class TestBatchDownloader:
         assert result.successful == 1
 
         # Check that progress updates were sent
-        updates = []
-        while not progress_queue.empty():
-            updates.append(progress_queue.get())
+        updates = progress_queue.items
 
         # Should have started, progress, and complete events
         events = [u.event for u in updates]
         assert "started" in events
         assert "complete" in events
 
-    @patch("yt_audio_cli.download.batch.download")
-    @patch("yt_audio_cli.download.batch.transcode")
-    def test_multiple_parallel_downloads(
+    @pytest.mark.parametrize(
+        ("interval", "sizes", "expected"),
+        [
+            (0, (500, 501, 502, 999, 1000, 1000), [50, 99, 100]),
+            (60, (500, 501, 502, 999, 1000, 1000), [50, 100]),
+            (60, (500, 1000, 950, 1000, 1200), [50, 100]),
+        ],
+        ids=["per-percent", "throttled", "completion-once"],
+    )
+    @pytest.mark.usefixtures("transcode_stub")
+    def test_progress_updates_coalesced(
         self,
-        mock_transcode: MagicMock,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        download_stub: Stub,
+        input_file: Path,
+        tmp_path: Path,
+        interval: float,
+        sizes: tuple[int, ...],
+        expected: list[int],
     ) -> None:
-        """Test parallel download of multiple URLs."""
-        call_count = [0]
+        """Test progress events are emitted per percent and time-throttled."""
+        monkeypatch.setattr(batch, "_PROGRESS_INTERVAL", interval)
 
-        def create_download_result(**kwargs):
-            url = kwargs.get("url")
-            output_dir = kwargs.get("output_dir")
-            call_count[0] += 1
-            # Create a unique temp file for each call
-            temp_audio = output_dir / f"temp_audio_{call_count[0]}.webm"
-            temp_audio.write_bytes(b"fake audio data")
-            return DownloadResult(
-                url=url,
-                title=f"Test Video {call_count[0]}",
-                artist="Test Artist",
-                temp_path=temp_audio,
-                duration=120.0,
-                success=True,
+        def download_with_progress(**kwargs):
+            progress_callback = kwargs.get("progress_callback")
+            for downloaded in sizes:
+                progress_callback(downloaded, 1000)
+            return replace(
+                _SUCCESS_RESULT,
+                url=kwargs.get("url"),
+                temp_path=input_file,
             )
 
-        mock_download.side_effect = create_download_result
+        download_stub.result = download_with_progress
 
-        def create_output(*args, **kwargs):
-            output_path = args[1] if len(args) > 1 else kwargs.get("output_path")
-            if output_path:
-                output_path.write_bytes(b"converted audio")
-            return True
+        progress_queue = _ProgressRecorder()
+        request = BatchRequest(max_workers=1)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
+
+        downloader = BatchDownloader(
+            request=request,
+            output_dir=tmp_path,
+            progress_queue=progress_queue,
+        )
+        downloader.run()
+
+        updates = progress_queue.items
+
+        percents = [u.percent for u in updates if u.event == "progress"]
+        assert percents == expected
 
-        mock_transcode.side_effect = create_output
+    @pytest.mark.usefixtures("transcode_stub")
+    def test_progress_clamped_when_estimate_exceeded(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        download_stub: Stub,
+        input_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test overshooting an estimated size reports 100 only once."""
+        monkeypatch.setattr(batch, "_PROGRESS_INTERVAL", 0)
+
+        def download_with_progress(**kwargs):
+            progress_callback = kwargs.get("progress_callback")
+            # Estimated 1000 bytes, actually 1200
+            for downloaded in range(4, 1204, 4):
+                progress_callback(downloaded, 1000)
+            return replace(
+                _SUCCESS_RESULT,
+                url=kwargs.get("url"),
+                temp_path=input_file,
+            )
+
+        download_stub.result = download_with_progress
+
+        progress_queue = _ProgressRecorder()
+        request = BatchRequest(max_workers=1)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
+
+        downloader = BatchDownloader(
+            request=request,
+            output_dir=tmp_path,
+            progress_queue=progress_queue,
+        )
+        downloader.run()
+
+        percents = [u.percent for u in progress_queue.items if u.event == "progress"]
+        assert percents == list(range(1, 101))
+
+    @pytest.mark.usefixtures("immediate_executor")
+    def test_many_jobs_inline(
+        self,
+        transcode_stub: Stub,
+        download_stub: Stub,
+        input_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test workers drain more jobs than there are workers."""
+        download_stub.result = _make_download_side_effect(input_file)
+        transcode_stub.result = _write_converted
 
         request = BatchRequest(max_workers=4)
-        for i in range(10):
-            request.add_job(f"https://youtube.com/watch?v=test{i}", temp_dir)
+        request.add_jobs(
+            (f"https://youtube.com/watch?v=test{i}" for i in range(10)), tmp_path
+        )
 
         downloader = BatchDownloader(
             request=request,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
         )
 
         result = downloader.run()
@@ -226,45 +351,82 @@ class TestBatchDownloader:
         assert result.successful == 10
         assert result.failed == 0
 
+    def test_unexpected_job_error_counts_as_failed(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        """Test an exception escaping a job is counted as a failure."""
 
-class TestDownloadBatch:
-    """Tests for download_batch convenience function."""
+        def raise_error(_job, _worker_id):
+            raise RuntimeError("boom")
 
-    @patch("yt_audio_cli.download.batch.download")
-    @patch("yt_audio_cli.download.batch.transcode")
-    def test_download_batch_function(
+        request = BatchRequest(max_workers=2)
+        request.add_jobs(
+            (f"https://youtube.com/watch?v=test{i}" for i in range(3)), tmp_path
+        )
+
+        downloader = BatchDownloader(
+            request=request,
+            output_dir=tmp_path,
+        )
+        monkeypatch.setattr(downloader, "_process_job_with_retry", raise_error)
+        downloader.run()
+
+        assert request.failed == 3
+        assert request.pending == 0
+
+    @pytest.mark.usefixtures("immediate_executor", "transcode_stub")
+    def test_shutdown_leaves_queued_jobs_pending(
         self,
-        mock_transcode: MagicMock,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        download_stub: Stub,
+        input_file: Path,
+        tmp_path: Path,
     ) -> None:
-        """Test the download_batch convenience function."""
-        call_count = [0]
+        """Test jobs still queued at shutdown are never started."""
 
-        def create_download_result(**kwargs):
-            url = kwargs.get("url")
-            output_dir = kwargs.get("output_dir")
-            call_count[0] += 1
-            temp_audio = output_dir / f"temp_audio_{call_count[0]}.webm"
-            temp_audio.write_bytes(b"fake audio data")
-            return DownloadResult(
-                url=url,
-                title=f"Test Video {call_count[0]}",
-                artist="Test Artist",
-                temp_path=temp_audio,
-                duration=120.0,
-                success=True,
-            )
+        def download_and_shutdown(**kwargs):
+            shutdown_event.set()
+            return replace(_SUCCESS_RESULT, url=kwargs.get("url"), temp_path=input_file)
 
-        mock_download.side_effect = create_download_result
+        download_stub.result = download_and_shutdown
 
-        def create_output(*args, **kwargs):
-            output_path = args[1] if len(args) > 1 else kwargs.get("output_path")
-            if output_path:
-                output_path.write_bytes(b"converted audio")
-            return True
+        request = BatchRequest(max_workers=1)
+        request.add_jobs(
+            (f"https://youtube.com/watch?v=test{i}" for i in range(3)), tmp_path
+        )
+
+        downloader = BatchDownloader(
+            request=request,
+            output_dir=tmp_path,
+        )
+        result = downloader.run()
+
+        assert len(download_stub.calls) == 1
+        assert [job.status for job in request.jobs] == [
+            JobStatus.CANCELLED,
+            JobStatus.PENDING,
+            JobStatus.PENDING,
+        ]
+        assert request.cancelled == 1
+        assert request.pending == 2
+        assert result.successful == 0
+        assert result.failed == 0
+
+
+class TestDownloadBatch:
+    """Tests for download_batch convenience function."""
 
-        mock_transcode.side_effect = create_output
+    def test_download_batch_function(
+        self,
+        transcode_stub: Stub,
+        download_stub: Stub,
+        input_file: Path,
+        tmp_path: Path,
+    ) -> None:
+        """Test the download_batch convenience function."""
+        download_stub.result = _make_download_side_effect(input_file)
+        transcode_stub.result = _write_converted
 
         urls = [
             "https://youtube.com/watch?v=test1",
@@ -273,7 +435,7 @@ class TestDownloadBatch:
 
         result = download_batch(
             urls=urls,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
             audio_format="mp3",
             max_workers=2,
         )
@@ -281,28 +443,21 @@ class TestDownloadBatch:
         assert result.total == 2
         assert result.successful == 2
 
-    @patch("yt_audio_cli.download.batch.download")
     def test_download_batch_with_failures(
         self,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        download_stub: Stub,
+        tmp_path: Path,
     ) -> None:
         """Test download_batch with some failures."""
-        mock_download.return_value = DownloadResult(
-            url="https://youtube.com/watch?v=test",
-            title="",
-            artist="",
-            temp_path=Path(),
-            duration=None,
-            success=False,
-            error="Video unavailable",
+        download_stub.result = replace(
+            _FAILURE_RESULT, url="https://youtube.com/watch?v=test"
         )
 
         urls = ["https://youtube.com/watch?v=test1"]
 
         result = download_batch(
             urls=urls,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
             max_workers=1,
         )
 
@@ -314,19 +469,18 @@ class TestDownloadBatch:
 class TestBatchDownloaderEdgeCases:
     """Tests for edge cases in BatchDownloader."""
 
-    @patch("yt_audio_cli.download.batch.download")
     def test_shutdown_at_start(
         self,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        download_stub: Stub,
+        tmp_path: Path,
     ) -> None:
         """Test shutdown requested before download starts."""
         request = BatchRequest(max_workers=1)
-        request.add_job("https://youtube.com/watch?v=test", temp_dir)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
 
         downloader = BatchDownloader(
             request=request,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
         )
 
         # Request shutdown before running
@@ -336,106 +490,93 @@ class TestBatchDownloaderEdgeCases:
         # Job should be cancelled - not counted as failed or successful
         assert result.successful == 0
         assert result.total == 1
-        mock_download.assert_not_called()
+        assert not download_stub.calls
 
-    @patch("yt_audio_cli.download.batch.download")
     def test_temp_file_not_found(
         self,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        download_stub: Stub,
+        tmp_path: Path,
     ) -> None:
         """Test handling when temp file doesn't exist after download."""
         # Return success but with non-existent temp path
-        mock_download.return_value = DownloadResult(
+        download_stub.result = replace(
+            _SUCCESS_RESULT,
             url="https://youtube.com/watch?v=test",
-            title="Test Video",
-            artist="Test Artist",
-            temp_path=temp_dir / "nonexistent.webm",
-            duration=120.0,
-            success=True,
+            temp_path=tmp_path / "nonexistent.webm",
         )
 
         request = BatchRequest(max_workers=1)
-        request.add_job("https://youtube.com/watch?v=test", temp_dir)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
 
         downloader = BatchDownloader(
             request=request,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
         )
 
         result = downloader.run()
         assert result.failed == 1
         assert "not found" in result.failed_jobs[0].error_message.lower()
 
-    @patch("yt_audio_cli.download.batch.download")
     def test_download_raises_exception(
         self,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        download_stub: Stub,
+        tmp_path: Path,
     ) -> None:
         """Test handling when download raises an exception."""
-        mock_download.side_effect = RuntimeError("Unexpected error")
+        download_stub.result = RuntimeError("Unexpected error")
 
         request = BatchRequest(max_workers=1)
-        request.add_job("https://youtube.com/watch?v=test", temp_dir)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
 
         downloader = BatchDownloader(
             request=request,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
         )
 
         result = downloader.run()
         assert result.failed == 1
         assert "unexpected error" in result.failed_jobs[0].error_message.lower()
 
-    @patch("yt_audio_cli.download.batch.download")
-    @patch("yt_audio_cli.download.batch.transcode")
     def test_conversion_raises_exception(
         self,
-        mock_transcode: MagicMock,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        transcode_stub: Stub,
+        download_stub: Stub,
+        input_file: Path,
+        tmp_path: Path,
     ) -> None:
         """Test handling when conversion raises an exception."""
-        temp_audio = temp_dir / "temp_audio.webm"
-        temp_audio.write_bytes(b"fake audio data")
 
-        mock_download.return_value = DownloadResult(
+        download_stub.result = replace(
+            _SUCCESS_RESULT,
             url="https://youtube.com/watch?v=test",
-            title="Test Video",
-            artist="Test Artist",
-            temp_path=temp_audio,
-            duration=120.0,
-            success=True,
+            temp_path=input_file,
         )
-        mock_transcode.side_effect = RuntimeError("Conversion error")
+        transcode_stub.result = RuntimeError("Conversion error")
 
         request = BatchRequest(max_workers=1)
-        request.add_job("https://youtube.com/watch?v=test", temp_dir)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
 
         downloader = BatchDownloader(
             request=request,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
         )
 
         result = downloader.run()
         assert result.failed == 1
         assert "conversion" in result.failed_jobs[0].error_message.lower()
 
-    @patch("yt_audio_cli.download.batch.download")
-    @patch("yt_audio_cli.download.batch.time.sleep")
     def test_retry_on_retryable_error(
         self,
-        mock_sleep: MagicMock,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        transcode_stub: Stub,
+        download_stub: Stub,
+        input_file: Path,
+        tmp_path: Path,
     ) -> None:
         """Test retry logic for retryable errors."""
-        call_count = [0]
 
         def download_with_retry(**kwargs):
-            call_count[0] += 1
-            if call_count[0] < 2:
+            if len(download_stub.calls) < 2:
                 # First call fails with retryable error
                 return DownloadResult(
                     url=kwargs.get("url"),
@@ -447,153 +588,158 @@ class TestBatchDownloaderEdgeCases:
                     error="Connection timeout",
                 )
             # Second call succeeds
-            output_dir = kwargs.get("output_dir")
-            temp_audio = output_dir / "temp.webm"
-            temp_audio.write_bytes(b"data")
             return DownloadResult(
                 url=kwargs.get("url"),
                 title="Test",
                 artist="Artist",
-                temp_path=temp_audio,
+                temp_path=input_file,
                 duration=60.0,
                 success=True,
             )
 
-        mock_download.side_effect = download_with_retry
+        download_stub.result = download_with_retry
+        transcode_stub.result = _write_converted
+        waits: list[float] = []
+
+        def record_wait(timeout: float) -> bool:
+            waits.append(timeout)
+            return False
+
+        monkeypatch.setattr(shutdown_event, "wait", record_wait)
 
         request = BatchRequest(max_workers=1, max_retries=3)
-        request.add_job("https://youtube.com/watch?v=test", temp_dir)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
 
         retry_config = RetryConfig(max_attempts=3, base_delay=0.01)
         downloader = BatchDownloader(
             request=request,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
             retry_config=retry_config,
         )
 
-        # Mock transcode to succeed
-        with patch("yt_audio_cli.download.batch.transcode") as mock_transcode:
+        downloader.run()
+
+        # Should retry and eventually succeed
+        assert len(download_stub.calls) == 2
+        assert len(waits) == 1
+
+    def test_shutdown_during_retry_backoff(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        download_stub: Stub,
+        tmp_path: Path,
+    ) -> None:
+        """Test a shutdown signalled during backoff cancels the job."""
+        download_stub.result = replace(
+            _FAILURE_RESULT,
+            url="https://youtube.com/watch?v=test",
+            error="Connection timeout",
+        )
+
+        def interrupted_wait(_timeout: float) -> bool:
+            shutdown_event.set()
+            return True
 
-            def create_output(*args, **kwargs):
-                output_path = args[1] if len(args) > 1 else kwargs.get("output_path")
-                if output_path:
-                    output_path.write_bytes(b"converted")
-                return True
+        monkeypatch.setattr(shutdown_event, "wait", interrupted_wait)
 
-            mock_transcode.side_effect = create_output
-            downloader.run()
+        request = BatchRequest(max_workers=1, max_retries=3)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
 
-        # Should retry and eventually succeed
-        assert call_count[0] == 2
-        assert mock_sleep.called
+        downloader = BatchDownloader(
+            request=request,
+            output_dir=tmp_path,
+            retry_config=RetryConfig(max_attempts=3, base_delay=30.0),
+        )
+        downloader.run()
+
+        assert len(download_stub.calls) == 1
+        assert request.jobs[0].status == JobStatus.CANCELLED
 
-    @patch("yt_audio_cli.download.batch.download")
     def test_no_retry_on_permanent_error(
         self,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        download_stub: Stub,
+        tmp_path: Path,
     ) -> None:
         """Test no retry for permanent errors like 'Video unavailable'."""
-        mock_download.return_value = DownloadResult(
-            url="https://youtube.com/watch?v=test",
-            title="",
-            artist="",
-            temp_path=Path(),
-            duration=None,
-            success=False,
-            error="Video unavailable",
+        download_stub.result = replace(
+            _FAILURE_RESULT, url="https://youtube.com/watch?v=test"
         )
 
         request = BatchRequest(max_workers=1, max_retries=3)
-        request.add_job("https://youtube.com/watch?v=test", temp_dir)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
 
         retry_config = RetryConfig(max_attempts=3)
         downloader = BatchDownloader(
             request=request,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
             retry_config=retry_config,
         )
 
         result = downloader.run()
         # Should fail immediately without retrying
         assert result.failed == 1
-        assert mock_download.call_count == 1
+        assert len(download_stub.calls) == 1
 
-    @patch("yt_audio_cli.download.batch.download")
-    @patch("yt_audio_cli.download.batch.transcode")
     def test_shutdown_after_download(
         self,
-        mock_transcode: MagicMock,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        transcode_stub: Stub,
+        download_stub: Stub,
+        input_file: Path,
+        tmp_path: Path,
     ) -> None:
         """Test shutdown requested after download but before conversion."""
-        temp_audio = temp_dir / "temp_audio.webm"
-        temp_audio.write_bytes(b"fake audio data")
 
         def download_and_shutdown(**kwargs):
             # Request shutdown after download
             shutdown_event.set()
-            return DownloadResult(
+            return replace(
+                _SUCCESS_RESULT,
                 url=kwargs.get("url"),
-                title="Test Video",
-                artist="Test Artist",
-                temp_path=temp_audio,
-                duration=120.0,
-                success=True,
+                temp_path=input_file,
             )
 
-        mock_download.side_effect = download_and_shutdown
+        download_stub.result = download_and_shutdown
 
         request = BatchRequest(max_workers=1)
-        request.add_job("https://youtube.com/watch?v=test", temp_dir)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
 
         downloader = BatchDownloader(
             request=request,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
         )
 
         result = downloader.run()
         # Should be cancelled - not counted as failed or successful
         assert result.successful == 0
         assert result.total == 1
-        mock_transcode.assert_not_called()
+        assert not transcode_stub.calls
 
-    @patch("yt_audio_cli.download.batch.download")
-    @patch("yt_audio_cli.download.batch.transcode")
     def test_download_without_title(
         self,
-        mock_transcode: MagicMock,
-        mock_download: MagicMock,
-        temp_dir: Path,
+        transcode_stub: Stub,
+        download_stub: Stub,
+        input_file: Path,
+        tmp_path: Path,
     ) -> None:
         """Test download result with empty title."""
-        temp_audio = temp_dir / "temp_audio.webm"
-        temp_audio.write_bytes(b"fake audio data")
 
-        mock_download.return_value = DownloadResult(
+        download_stub.result = DownloadResult(
             url="https://youtube.com/watch?v=test",
             title="",  # Empty title
             artist="Test Artist",
-            temp_path=temp_audio,
+            temp_path=input_file,
             duration=120.0,
             success=True,
         )
 
-        def create_output(*args, **kwargs):
-            output_path = args[1] if len(args) > 1 else kwargs.get("output_path")
-            if output_path:
-                output_path.write_bytes(b"converted audio")
-            return True
-
-        mock_transcode.side_effect = create_output
+        transcode_stub.result = _write_converted
 
         request = BatchRequest(max_workers=1)
-        request.add_job("https://youtube.com/watch?v=test", temp_dir)
+        request.add_job("https://youtube.com/watch?v=test", tmp_path)
 
         downloader = BatchDownloader(
             request=request,
-            output_dir=temp_dir,
+            output_dir=tmp_path,
         )
 
         result = downloader.run()
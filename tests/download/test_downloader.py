@@ -22,7 +22,6 @@ def _create_mock_ydl(
         mock_ydl.extract_info.side_effect = raise_error
     else:
         mock_ydl.extract_info.return_value = info
-        mock_ydl.sanitize_info.return_value = info
 
     return mock_ydl
 
@@ -81,11 +80,11 @@ class TestPlaylistEntry:
 class TestDownload:
     """Tests for download() function."""
 
-    def test_download_success(self, temp_dir: Path) -> None:
+    def test_download_success(self, tmp_path: Path) -> None:
         """Test successful download."""
         from yt_audio_cli.download.downloader import download
 
-        temp_file = temp_dir / "test123.webm"
+        temp_file = tmp_path / "test123.webm"
         temp_file.touch()
 
         mock_info = {
@@ -103,7 +102,7 @@ class TestDownload:
             result = download(
                 "https://youtube.com/watch?v=test123",
                 progress_callback=lambda _d, _t: None,
-                output_dir=temp_dir,
+                output_dir=tmp_path,
             )
 
             assert result.success is True
@@ -111,12 +110,13 @@ class TestDownload:
             assert result.artist == "Test Channel"
             assert result.duration == 180
             assert result.temp_path == temp_file
+            mock_ydl.sanitize_info.assert_not_called()
 
-    def test_download_with_channel_fallback(self, temp_dir: Path) -> None:
+    def test_download_with_channel_fallback(self, tmp_path: Path) -> None:
         """Test download uses channel when uploader is missing."""
         from yt_audio_cli.download.downloader import download
 
-        temp_file = temp_dir / "test123.webm"
+        temp_file = tmp_path / "test123.webm"
         temp_file.touch()
 
         mock_info = {
@@ -134,12 +134,12 @@ class TestDownload:
             result = download(
                 "https://youtube.com/watch?v=test123",
                 progress_callback=lambda _d, _t: None,
-                output_dir=temp_dir,
+                output_dir=tmp_path,
             )
 
             assert result.artist == "Test Channel"
 
-    def test_download_fallback_path(self, temp_dir: Path) -> None:
+    def test_download_fallback_path(self, tmp_path: Path) -> None:
         """Test download constructs path when requested_downloads missing."""
         from yt_audio_cli.download.downloader import download
 
@@ -157,13 +157,13 @@ class TestDownload:
             result = download(
                 "https://youtube.com/watch?v=test123",
                 progress_callback=lambda _d, _t: None,
-                output_dir=temp_dir,
+                output_dir=tmp_path,
             )
 
             assert result.success is True
-            assert result.temp_path == temp_dir / "test123.webm"
+            assert result.temp_path == tmp_path / "test123.webm"
 
-    def test_download_fallback_when_filepath_missing(self, temp_dir: Path) -> None:
+    def test_download_fallback_when_filepath_missing(self, tmp_path: Path) -> None:
         """Test download falls back when filepath key is missing."""
         from yt_audio_cli.download.downloader import download
 
@@ -182,13 +182,13 @@ class TestDownload:
             result = download(
                 "https://youtube.com/watch?v=test123",
                 progress_callback=lambda _d, _t: None,
-                output_dir=temp_dir,
+                output_dir=tmp_path,
             )
 
             assert result.success is True
-            assert result.temp_path == temp_dir / "test123.webm"
+            assert result.temp_path == tmp_path / "test123.webm"
 
-    def test_download_fallback_when_filepath_empty(self, temp_dir: Path) -> None:
+    def test_download_fallback_when_filepath_empty(self, tmp_path: Path) -> None:
         """Test download falls back when filepath is empty string."""
         from yt_audio_cli.download.downloader import download
 
@@ -207,14 +207,14 @@ class TestDownload:
             result = download(
                 "https://youtube.com/watch?v=test123",
                 progress_callback=lambda _d, _t: None,
-                output_dir=temp_dir,
+                output_dir=tmp_path,
             )
 
             assert result.success is True
-            assert result.temp_path == temp_dir / "test123.webm"
+            assert result.temp_path == tmp_path / "test123.webm"
 
     def test_download_fallback_when_first_download_not_dict(
-        self, temp_dir: Path
+        self, tmp_path: Path
     ) -> None:
         """Test download falls back when first download entry is not a dict."""
         from yt_audio_cli.download.downloader import download
@@ -234,13 +234,13 @@ class TestDownload:
             result = download(
                 "https://youtube.com/watch?v=test123",
                 progress_callback=lambda _d, _t: None,
-                output_dir=temp_dir,
+                output_dir=tmp_path,
             )
 
             assert result.success is True
-            assert result.temp_path == temp_dir / "test123.webm"
+            assert result.temp_path == tmp_path / "test123.webm"
 
-    def test_download_failure(self, temp_dir: Path) -> None:
+    def test_download_failure(self, tmp_path: Path) -> None:
         """Test download failure returns error result."""
         from yt_audio_cli.download.downloader import download
 
@@ -250,14 +250,14 @@ class TestDownload:
             result = download(
                 "https://youtube.com/watch?v=invalid",
                 progress_callback=lambda _d, _t: None,
-                output_dir=temp_dir,
+                output_dir=tmp_path,
             )
 
             assert result.success is False
             assert result.error is not None
             assert "Video unavailable" in result.error
 
-    def test_download_none_info(self, temp_dir: Path) -> None:
+    def test_download_none_info(self, tmp_path: Path) -> None:
         """Test download handles None info result."""
         from yt_audio_cli.download.downloader import download
 
@@ -267,7 +267,7 @@ class TestDownload:
             result = download(
                 "https://youtube.com/watch?v=test",
                 progress_callback=lambda _d, _t: None,
-                output_dir=temp_dir,
+                output_dir=tmp_path,
             )
 
             assert result.success is False
@@ -596,6 +596,7 @@ class TestExtractMetadata:
         }
 
         mock_ydl = _create_mock_ydl(mock_info)
+        mock_ydl.sanitize_info.return_value = mock_info
 
         with patch("yt_audio_cli.download.downloader.YoutubeDL", return_value=mock_ydl):
             result = extract_metadata("https://youtube.com/watch?v=test123")
@@ -679,10 +680,20 @@ class TestPlaylistDetection:
 
         assert is_playlist("ftp://youtube.com/playlist?list=test") is False
 
+    def test_url_without_markers_skips_parsing(self) -> None:
+        """Test URLs without list=/playlist markers are rejected before parsing."""
+        from yt_audio_cli.download.downloader import is_playlist
+
+        with patch("yt_audio_cli.download.downloader.urlparse") as mock_urlparse:
+            assert is_playlist("https://youtube.com/watch?v=skip") is False
+
+        mock_urlparse.assert_not_called()
+
     def test_urlparse_exception_returns_false(self) -> None:
         """Test URL that causes urlparse exception returns False."""
-        from yt_audio_cli.download.downloader import is_playlist
+        from yt_audio_cli.download.downloader import _is_playlist_url, is_playlist
 
+        _is_playlist_url.cache_clear()
         with patch(
             "yt_audio_cli.download.downloader.urlparse",
             side_effect=ValueError("parse error"),
@@ -767,6 +778,16 @@ class TestCleanErrorMessage:
 
         assert result == "Video unavailable"
 
+    def test_uses_last_error_prefix(self) -> None:
+        """Test only the text after the last ERROR: prefix is kept."""
+        from yt_audio_cli.download.downloader import _clean_error_message
+
+        error = "ERROR: first failure\nERROR:   Video unavailable  \ntraceback"
+
+        result = _clean_error_message(error)
+
+        assert result == "Video unavailable"
+
     def test_returns_first_line(self) -> None:
         """Test returns first line of multi-line error."""
         from yt_audio_cli.download.downloader import _clean_error_message
@@ -823,3 +844,11 @@ class TestSafeParseDuration:
         assert _safe_parse_duration("invalid") is None
         assert _safe_parse_duration(-10) is None
         assert _safe_parse_duration(100000) is None  # > 86400
+
+    def test_returns_none_for_non_finite_or_huge(self) -> None:
+        """Test returns None for NaN and integers too large for a float."""
+        from yt_audio_cli.download.downloader import _safe_parse_duration
+
+        assert _safe_parse_duration(float("nan")) is None
+        assert _safe_parse_duration(float("inf")) is None
+        assert _safe_parse_duration(10**400) is None
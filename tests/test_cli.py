@@ -533,21 +533,21 @@ class TestMetadataEmbedding:
 class TestCheckExists:
     """Tests for _check_exists() helper function."""
 
-    def test_returns_true_when_file_exists(self, temp_dir: Any) -> None:
+    def test_returns_true_when_file_exists(self, tmp_path: Any) -> None:
         """Test returns True when output file already exists."""
         from pathlib import Path
 
         from yt_audio_cli.cli import _check_exists
 
         # Create existing file
-        (temp_dir / "Test_Video.mp3").touch()
+        (tmp_path / "Test_Video.mp3").touch()
 
         with patch("yt_audio_cli.cli.extract_metadata") as mock_extract:
             mock_extract.return_value = {"title": "Test Video"}
-            result = _check_exists("https://test.com", "mp3", Path(temp_dir))
+            result = _check_exists("https://test.com", "mp3", Path(tmp_path))
             assert result is True
 
-    def test_returns_false_when_file_missing(self, temp_dir: Any) -> None:
+    def test_returns_false_when_file_missing(self, tmp_path: Any) -> None:
         """Test returns False when output file doesn't exist."""
         from pathlib import Path
 
@@ -555,10 +555,10 @@ class TestCheckExists:
 
         with patch("yt_audio_cli.cli.extract_metadata") as mock_extract:
             mock_extract.return_value = {"title": "Test Video"}
-            result = _check_exists("https://test.com", "mp3", Path(temp_dir))
+            result = _check_exists("https://test.com", "mp3", Path(tmp_path))
             assert result is False
 
-    def test_returns_false_when_metadata_extraction_fails(self, temp_dir: Any) -> None:
+    def test_returns_false_when_metadata_extraction_fails(self, tmp_path: Any) -> None:
         """Test returns False when metadata extraction fails."""
         from pathlib import Path
 
@@ -566,10 +566,10 @@ class TestCheckExists:
 
         with patch("yt_audio_cli.cli.extract_metadata") as mock_extract:
             mock_extract.return_value = None
-            result = _check_exists("https://test.com", "mp3", Path(temp_dir))
+            result = _check_exists("https://test.com", "mp3", Path(tmp_path))
             assert result is False
 
-    def test_returns_false_when_title_empty(self, temp_dir: Any) -> None:
+    def test_returns_false_when_title_empty(self, tmp_path: Any) -> None:
         """Test returns False when title is empty."""
         from pathlib import Path
 
@@ -577,10 +577,10 @@ class TestCheckExists:
 
         with patch("yt_audio_cli.cli.extract_metadata") as mock_extract:
             mock_extract.return_value = {"title": ""}
-            result = _check_exists("https://test.com", "mp3", Path(temp_dir))
+            result = _check_exists("https://test.com", "mp3", Path(tmp_path))
             assert result is False
 
-    def test_returns_false_when_sanitized_filename_empty(self, temp_dir: Any) -> None:
+    def test_returns_false_when_sanitized_filename_empty(self, tmp_path: Any) -> None:
         """Test returns False when sanitized filename is empty (special chars only)."""
         from pathlib import Path
 
@@ -592,7 +592,7 @@ class TestCheckExists:
         ):
             mock_extract.return_value = {"title": "***"}
             mock_sanitize.return_value = ""  # sanitize returns empty for special chars
-            result = _check_exists("https://test.com", "mp3", Path(temp_dir))
+            result = _check_exists("https://test.com", "mp3", Path(tmp_path))
             assert result is False
 
 
@@ -600,7 +600,7 @@ class TestFilterExistingEntries:
     """Tests for _filter_existing_entries() helper function."""
 
     def test_filters_out_existing_files_with_prefetched_titles(
-        self, temp_dir: Any
+        self, tmp_path: Any
     ) -> None:
         """Test filters out entries with existing files using pre-fetched titles."""
         from pathlib import Path
@@ -609,21 +609,21 @@ class TestFilterExistingEntries:
         from yt_audio_cli.download import PlaylistEntry
 
         # Create existing file for first entry
-        (temp_dir / "Video_1.mp3").touch()
+        (tmp_path / "Video_1.mp3").touch()
 
         entries = [
             PlaylistEntry(url="https://test.com/1", title="Video 1"),  # exists
             PlaylistEntry(url="https://test.com/2", title="Video 2"),  # doesn't exist
             PlaylistEntry(url="https://test.com/3", title="Video 3"),  # doesn't exist
         ]
-        result, skipped = _filter_existing_entries(entries, "mp3", Path(temp_dir))
+        result, skipped = _filter_existing_entries(entries, "mp3", Path(tmp_path))
 
         assert len(result) == 2
         assert skipped == 1
         assert "https://test.com/2" in result
         assert "https://test.com/3" in result
 
-    def test_returns_all_urls_when_none_exist(self, temp_dir: Any) -> None:
+    def test_returns_all_urls_when_none_exist(self, tmp_path: Any) -> None:
         """Test returns all URLs when no files exist."""
         from pathlib import Path
 
@@ -634,12 +634,12 @@ class TestFilterExistingEntries:
             PlaylistEntry(url="https://test.com/1", title="New Video 1"),
             PlaylistEntry(url="https://test.com/2", title="New Video 2"),
         ]
-        result, skipped = _filter_existing_entries(entries, "mp3", Path(temp_dir))
+        result, skipped = _filter_existing_entries(entries, "mp3", Path(tmp_path))
 
         assert len(result) == 2
         assert skipped == 0
 
-    def test_returns_empty_when_all_exist(self, temp_dir: Any) -> None:
+    def test_returns_empty_when_all_exist(self, tmp_path: Any) -> None:
         """Test returns empty list when all files exist."""
         from pathlib import Path
 
@@ -647,19 +647,19 @@ class TestFilterExistingEntries:
         from yt_audio_cli.download import PlaylistEntry
 
         # Create existing files
-        (temp_dir / "Video_1.mp3").touch()
-        (temp_dir / "Video_2.mp3").touch()
+        (tmp_path / "Video_1.mp3").touch()
+        (tmp_path / "Video_2.mp3").touch()
 
         entries = [
             PlaylistEntry(url="https://test.com/1", title="Video 1"),
             PlaylistEntry(url="https://test.com/2", title="Video 2"),
         ]
-        result, skipped = _filter_existing_entries(entries, "mp3", Path(temp_dir))
+        result, skipped = _filter_existing_entries(entries, "mp3", Path(tmp_path))
 
         assert len(result) == 0
         assert skipped == 2
 
-    def test_fetches_metadata_when_title_empty(self, temp_dir: Any) -> None:
+    def test_fetches_metadata_when_title_empty(self, tmp_path: Any) -> None:
         """Test fetches metadata when entry has no pre-fetched title."""
         from pathlib import Path
 
@@ -667,7 +667,7 @@ class TestFilterExistingEntries:
         from yt_audio_cli.download import PlaylistEntry
 
         # Create existing file
-        (temp_dir / "Fetched_Title.mp3").touch()
+        (tmp_path / "Fetched_Title.mp3").touch()
 
         with patch("yt_audio_cli.cli.extract_metadata") as mock_extract:
             mock_extract.return_value = {"title": "Fetched Title"}
@@ -675,7 +675,7 @@ class TestFilterExistingEntries:
             entries = [
                 PlaylistEntry(url="https://test.com/1", title=""),  # No title
             ]
-            result, skipped = _filter_existing_entries(entries, "mp3", Path(temp_dir))
+            result, skipped = _filter_existing_entries(entries, "mp3", Path(tmp_path))
 
             assert len(result) == 0
             assert skipped == 1
@@ -685,7 +685,7 @@ class TestFilterExistingEntries:
 class TestDownloadAudio:
     """Tests for _download_audio() helper function."""
 
-    def test_successful_download(self, temp_dir: Any) -> None:
+    def test_successful_download(self, tmp_path: Any) -> None:
         """Test successful download returns result."""
         from pathlib import Path
 
@@ -698,7 +698,7 @@ class TestDownloadAudio:
             title="Test",
             artist="Artist",
             duration=120.0,
-            temp_path=Path(temp_dir) / "test.webm",
+            temp_path=Path(tmp_path) / "test.webm",
             error=None,
         )
 
@@ -707,11 +707,11 @@ class TestDownloadAudio:
             patch("yt_audio_cli.cli.create_download_progress"),
         ):
             mock_download.return_value = mock_result
-            result = _download_audio("https://test.com", Path(temp_dir))
+            result = _download_audio("https://test.com", Path(tmp_path))
             assert result.success is True
             assert result.title == "Test"
 
-    def test_download_with_progress_callback(self, temp_dir: Any) -> None:
+    def test_download_with_progress_callback(self, tmp_path: Any) -> None:
         """Test download updates progress via callback."""
         from pathlib import Path
         from unittest.mock import MagicMock
@@ -725,7 +725,7 @@ class TestDownloadAudio:
             title="Test",
             artist="Artist",
             duration=120.0,
-            temp_path=Path(temp_dir) / "test.webm",
+            temp_path=Path(tmp_path) / "test.webm",
             error=None,
         )
 
@@ -742,7 +742,7 @@ class TestDownloadAudio:
             ),
         ):
             mock_download.return_value = mock_result
-            _download_audio("https://test.com", Path(temp_dir))
+            _download_audio("https://test.com", Path(tmp_path))
 
             # Verify progress.add_task was called
             mock_progress.add_task.assert_called_once()
@@ -751,7 +751,7 @@ class TestDownloadAudio:
 class TestConvertAudio:
     """Tests for _convert_audio() helper function."""
 
-    def test_successful_conversion(self, temp_dir: Any) -> None:
+    def test_successful_conversion(self, tmp_path: Any) -> None:
         """Test successful conversion returns output path."""
         from pathlib import Path
         from unittest.mock import MagicMock
@@ -760,7 +760,7 @@ class TestConvertAudio:
         from yt_audio_cli.download import DownloadResult
 
         # Create temp input file
-        temp_file = Path(temp_dir) / "input.webm"
+        temp_file = Path(tmp_path) / "input.webm"
         temp_file.touch()
 
         result = DownloadResult(
@@ -793,12 +793,12 @@ class TestConvertAudio:
                 return_value=mock_progress,
             ),
         ):
-            output_path = _convert_audio(result, Path(temp_dir), "mp3", 320, True)
+            output_path = _convert_audio(result, Path(tmp_path), "mp3", 320, True)
             assert output_path is not None
             assert output_path.suffix == ".mp3"
             mock_transcode.assert_called_once()
 
-    def test_conversion_with_ffmpeg_not_found(self, temp_dir: Any) -> None:
+    def test_conversion_with_ffmpeg_not_found(self, tmp_path: Any) -> None:
         """Test conversion handles FFmpegNotFoundError."""
         from pathlib import Path
         from unittest.mock import MagicMock
@@ -807,7 +807,7 @@ class TestConvertAudio:
         from yt_audio_cli.core import FFmpegNotFoundError
         from yt_audio_cli.download import DownloadResult
 
-        temp_file = Path(temp_dir) / "input.webm"
+        temp_file = Path(tmp_path) / "input.webm"
         temp_file.touch()
 
         result = DownloadResult(
@@ -834,10 +834,10 @@ class TestConvertAudio:
             patch("yt_audio_cli.cli.print_error"),
         ):
             mock_transcode.side_effect = FFmpegNotFoundError()
-            output_path = _convert_audio(result, Path(temp_dir), "mp3", 320, True)
+            output_path = _convert_audio(result, Path(tmp_path), "mp3", 320, True)
             assert output_path is None
 
-    def test_conversion_with_generic_error(self, temp_dir: Any) -> None:
+    def test_conversion_with_generic_error(self, tmp_path: Any) -> None:
         """Test conversion handles generic errors."""
         from pathlib import Path
         from unittest.mock import MagicMock
@@ -845,7 +845,7 @@ class TestConvertAudio:
         from yt_audio_cli.cli import _convert_audio
         from yt_audio_cli.download import DownloadResult
 
-        temp_file = Path(temp_dir) / "input.webm"
+        temp_file = Path(tmp_path) / "input.webm"
         temp_file.touch()
 
         result = DownloadResult(
@@ -872,10 +872,10 @@ class TestConvertAudio:
             patch("yt_audio_cli.cli.print_error"),
         ):
             mock_transcode.side_effect = RuntimeError("Unknown error")
-            output_path = _convert_audio(result, Path(temp_dir), "mp3", 320, True)
+            output_path = _convert_audio(result, Path(tmp_path), "mp3", 320, True)
             assert output_path is None
 
-    def test_conversion_without_metadata(self, temp_dir: Any) -> None:
+    def test_conversion_without_metadata(self, tmp_path: Any) -> None:
         """Test conversion without embedding metadata."""
         from pathlib import Path
         from unittest.mock import MagicMock
@@ -883,7 +883,7 @@ class TestConvertAudio:
         from yt_audio_cli.cli import _convert_audio
         from yt_audio_cli.download import DownloadResult
 
-        temp_file = Path(temp_dir) / "input.webm"
+        temp_file = Path(tmp_path) / "input.webm"
         temp_file.touch()
 
         result = DownloadResult(
@@ -908,7 +908,7 @@ class TestConvertAudio:
                 return_value=mock_progress,
             ),
         ):
-            _convert_audio(result, Path(temp_dir), "mp3", 320, False)
+            _convert_audio(result, Path(tmp_path), "mp3", 320, False)
             # Verify metadata is empty when embed_metadata=False
             call_kwargs = mock_transcode.call_args[1]
             assert call_kwargs["metadata"] == {}
@@ -917,7 +917,7 @@ class TestConvertAudio:
 class TestProcessSingleUrl:
     """Tests for process_single_url() function."""
 
-    def test_successful_download_and_conversion(self, temp_dir: Any) -> None:
+    def test_successful_download_and_conversion(self, tmp_path: Any) -> None:
         """Test successful download and conversion flow."""
         from pathlib import Path
 
@@ -930,7 +930,7 @@ class TestProcessSingleUrl:
             title="Test",
             artist="Artist",
             duration=120.0,
-            temp_path=Path(temp_dir) / "test.webm",
+            temp_path=Path(tmp_path) / "test.webm",
             error=None,
         )
 
@@ -940,22 +940,22 @@ class TestProcessSingleUrl:
             patch("yt_audio_cli.cli.print_success"),
             patch("tempfile.TemporaryDirectory") as mock_tempdir,
         ):
-            mock_tempdir.return_value.__enter__ = lambda s: str(temp_dir)
+            mock_tempdir.return_value.__enter__ = lambda s: str(tmp_path)
             mock_tempdir.return_value.__exit__ = lambda s, *args: None
             mock_download.return_value = mock_result
             mock_result.temp_path.touch()
-            mock_convert.return_value = Path(temp_dir) / "test.mp3"
+            mock_convert.return_value = Path(tmp_path) / "test.mp3"
 
             success = process_single_url(
                 "https://test.com",
                 "mp3",
-                Path(temp_dir),
+                Path(tmp_path),
                 320,
                 True,
             )
             assert success is True
 
-    def test_download_failure(self, temp_dir: Any) -> None:
+    def test_download_failure(self, tmp_path: Any) -> None:
         """Test handles download failure."""
         from pathlib import Path
 
@@ -968,7 +968,7 @@ class TestProcessSingleUrl:
             title="",
             artist="",
             duration=0.0,
-            temp_path=Path(temp_dir) / "test.webm",
+            temp_path=Path(tmp_path) / "test.webm",
             error="Connection failed",
         )
 
@@ -977,20 +977,20 @@ class TestProcessSingleUrl:
             patch("yt_audio_cli.cli.print_error"),
             patch("tempfile.TemporaryDirectory") as mock_tempdir,
         ):
-            mock_tempdir.return_value.__enter__ = lambda s: str(temp_dir)
+            mock_tempdir.return_value.__enter__ = lambda s: str(tmp_path)
             mock_tempdir.return_value.__exit__ = lambda s, *args: None
             mock_download.return_value = mock_result
 
             success = process_single_url(
                 "https://test.com",
                 "mp3",
-                Path(temp_dir),
+                Path(tmp_path),
                 320,
                 True,
             )
             assert success is False
 
-    def test_temp_file_not_found(self, temp_dir: Any) -> None:
+    def test_temp_file_not_found(self, tmp_path: Any) -> None:
         """Test handles missing temp file after download."""
         from pathlib import Path
 
@@ -1003,7 +1003,7 @@ class TestProcessSingleUrl:
             title="Test",
             artist="Artist",
             duration=120.0,
-            temp_path=Path(temp_dir) / "nonexistent.webm",
+            temp_path=Path(tmp_path) / "nonexistent.webm",
             error=None,
         )
 
@@ -1012,7 +1012,7 @@ class TestProcessSingleUrl:
             patch("yt_audio_cli.cli.print_error"),
             patch("tempfile.TemporaryDirectory") as mock_tempdir,
         ):
-            mock_tempdir.return_value.__enter__ = lambda s: str(temp_dir)
+            mock_tempdir.return_value.__enter__ = lambda s: str(tmp_path)
             mock_tempdir.return_value.__exit__ = lambda s, *args: None
             mock_download.return_value = mock_result
             # Don't create the temp file
@@ -1020,13 +1020,13 @@ class TestProcessSingleUrl:
             success = process_single_url(
                 "https://test.com",
                 "mp3",
-                Path(temp_dir),
+                Path(tmp_path),
                 320,
                 True,
             )
             assert success is False
 
-    def test_conversion_failure(self, temp_dir: Any) -> None:
+    def test_conversion_failure(self, tmp_path: Any) -> None:
         """Test handles conversion failure."""
         from pathlib import Path
 
@@ -1039,7 +1039,7 @@ class TestProcessSingleUrl:
             title="Test",
             artist="Artist",
             duration=120.0,
-            temp_path=Path(temp_dir) / "test.webm",
+            temp_path=Path(tmp_path) / "test.webm",
             error=None,
         )
 
@@ -1048,7 +1048,7 @@ class TestProcessSingleUrl:
             patch("yt_audio_cli.cli._convert_audio") as mock_convert,
             patch("tempfile.TemporaryDirectory") as mock_tempdir,
         ):
-            mock_tempdir.return_value.__enter__ = lambda s: str(temp_dir)
+            mock_tempdir.return_value.__enter__ = lambda s: str(tmp_path)
             mock_tempdir.return_value.__exit__ = lambda s, *args: None
             mock_download.return_value = mock_result
             mock_result.temp_path.touch()
@@ -1057,7 +1057,7 @@ class TestProcessSingleUrl:
             success = process_single_url(
                 "https://test.com",
                 "mp3",
-                Path(temp_dir),
+                Path(tmp_path),
                 320,
                 True,
             )
@@ -1067,7 +1067,7 @@ class TestProcessSingleUrl:
 class TestProcessUrlsSkipScenarios:
     """Tests for process_urls() skip and filter scenarios."""
 
-    def test_skipped_files_shows_warning(self, temp_dir: Any) -> None:
+    def test_skipped_files_shows_warning(self, tmp_path: Any) -> None:
         """Test shows warning when files are skipped."""
         from pathlib import Path
 
@@ -1093,14 +1093,14 @@ class TestProcessUrlsSkipScenarios:
                 successful=1,
                 failed=0,
                 skipped_duplicates=0,
-                successful_files=[Path(temp_dir) / "test.mp3"],
+                successful_files=[Path(tmp_path) / "test.mp3"],
                 failed_jobs=[],
             )
 
             process_urls(
                 urls=["https://test.com/1", "https://test.com/2"],
                 audio_format="mp3",
-                output_dir=Path(temp_dir),
+                output_dir=Path(tmp_path),
                 bitrate=320,
                 embed_metadata=True,
                 force=False,
@@ -1108,7 +1108,7 @@ class TestProcessUrlsSkipScenarios:
 
             mock_warning.assert_called_once_with("Skipped 1 already downloaded")
 
-    def test_nothing_to_download_when_all_skipped(self, temp_dir: Any) -> None:
+    def test_nothing_to_download_when_all_skipped(self, tmp_path: Any) -> None:
         """Test returns 0 when all files already exist."""
         from pathlib import Path
 
@@ -1129,7 +1129,7 @@ class TestProcessUrlsSkipScenarios:
             exit_code = process_urls(
                 urls=["https://test.com/1", "https://test.com/2"],
                 audio_format="mp3",
-                output_dir=Path(temp_dir),
+                output_dir=Path(tmp_path),
                 bitrate=320,
                 embed_metadata=True,
                 force=False,
@@ -1138,7 +1138,7 @@ class TestProcessUrlsSkipScenarios:
             assert exit_code == 0
             mock_info.assert_any_call("Nothing to download")
 
-    def test_single_url_after_filtering(self, temp_dir: Any) -> None:
+    def test_single_url_after_filtering(self, tmp_path: Any) -> None:
         """Test single URL path after filtering out existing files."""
         from pathlib import Path
 
@@ -1164,14 +1164,14 @@ class TestProcessUrlsSkipScenarios:
                 successful=1,
                 failed=0,
                 skipped_duplicates=0,
-                successful_files=[Path(temp_dir) / "test.mp3"],
+                successful_files=[Path(tmp_path) / "test.mp3"],
                 failed_jobs=[],
             )
 
             exit_code = process_urls(
                 urls=["https://test.com/1", "https://test.com/2"],
                 audio_format="mp3",
-                output_dir=Path(temp_dir),
+                output_dir=Path(tmp_path),
                 bitrate=320,
                 embed_metadata=True,
                 force=False,
@@ -1180,7 +1180,7 @@ class TestProcessUrlsSkipScenarios:
             assert exit_code == 0
             mock_batch.assert_called_once()
 
-    def test_force_skips_filtering(self, temp_dir: Any) -> None:
+    def test_force_skips_filtering(self, tmp_path: Any) -> None:
         """Test force=True skips the filtering step."""
         from pathlib import Path
 
@@ -1205,8 +1205,8 @@ class TestProcessUrlsSkipScenarios:
                 failed=0,
                 skipped_duplicates=0,
                 successful_files=[
-                    Path(temp_dir) / "test1.mp3",
-                    Path(temp_dir) / "test2.mp3",
+                    Path(tmp_path) / "test1.mp3",
+                    Path(tmp_path) / "test2.mp3",
                 ],
                 failed_jobs=[],
             )
@@ -1214,7 +1214,7 @@ class TestProcessUrlsSkipScenarios:
             process_urls(
                 urls=["https://test.com/1", "https://test.com/2"],
                 audio_format="mp3",
-                output_dir=Path(temp_dir),
+                output_dir=Path(tmp_path),
                 bitrate=320,
                 embed_metadata=True,
                 force=True,
@@ -1223,7 +1223,7 @@ class TestProcessUrlsSkipScenarios:
             # Filter should not be called when force=True
             mock_filter.assert_not_called()
 
-    def test_summary_includes_skip_count(self, temp_dir: Any) -> None:
+    def test_summary_includes_skip_count(self, tmp_path: Any) -> None:
         """Test summary includes skip count when files were skipped."""
         from pathlib import Path
 
@@ -1255,8 +1255,8 @@ class TestProcessUrlsSkipScenarios:
                 failed=0,
                 skipped_duplicates=0,
                 successful_files=[
-                    Path(temp_dir) / "test2.mp3",
-                    Path(temp_dir) / "test3.mp3",
+                    Path(tmp_path) / "test2.mp3",
+                    Path(tmp_path) / "test3.mp3",
                 ],
                 failed_jobs=[],
             )
@@ -1264,7 +1264,7 @@ class TestProcessUrlsSkipScenarios:
             process_urls(
                 urls=["https://test.com/1", "https://test.com/2", "https://test.com/3"],
                 audio_format="mp3",
-                output_dir=Path(temp_dir),
+                output_dir=Path(tmp_path),
                 bitrate=320,
                 embed_metadata=True,
                 force=False,
@@ -1277,7 +1277,7 @@ class TestProcessUrlsSkipScenarios:
 class TestProgressCallbacks:
     """Tests for progress callback execution in download/convert."""
 
-    def test_download_callback_with_total(self, temp_dir: Any) -> None:
+    def test_download_callback_with_total(self, tmp_path: Any) -> None:
         """Test download progress callback when total is known."""
         from pathlib import Path
         from unittest.mock import MagicMock
@@ -1291,7 +1291,7 @@ class TestProgressCallbacks:
             title="Test",
             artist="Artist",
             duration=120.0,
-            temp_path=Path(temp_dir) / "test.webm",
+            temp_path=Path(tmp_path) / "test.webm",
             error=None,
         )
 
@@ -1314,14 +1314,14 @@ class TestProgressCallbacks:
                 return_value=mock_progress,
             ),
         ):
-            _download_audio("https://test.com", Path(temp_dir))
+            _download_audio("https://test.com", Path(tmp_path))
 
             # Call the callback with total > 0
             assert captured_callback is not None  # NOSONAR - modified by closure
             captured_callback(1000, 5000)
             mock_progress.update.assert_called_with(1, completed=1000, total=5000)
 
-    def test_download_callback_without_total(self, temp_dir: Any) -> None:
+    def test_download_callback_without_total(self, tmp_path: Any) -> None:
         """Test download progress callback when total is unknown."""
         from pathlib import Path
         from unittest.mock import MagicMock
@@ -1335,7 +1335,7 @@ class TestProgressCallbacks:
             title="Test",
             artist="Artist",
             duration=120.0,
-            temp_path=Path(temp_dir) / "test.webm",
+            temp_path=Path(tmp_path) / "test.webm",
             error=None,
         )
 
@@ -1358,14 +1358,64 @@ class TestProgressCallbacks:
                 return_value=mock_progress,
             ),
         ):
-            _download_audio("https://test.com", Path(temp_dir))
+            _download_audio("https://test.com", Path(tmp_path))
 
             # Call the callback with total = 0
             assert captured_callback is not None  # NOSONAR - modified by closure
             captured_callback(1000, 0)
             mock_progress.update.assert_called_with(1, completed=1000)
 
-    def test_convert_callback_updates_progress(self, temp_dir: Any) -> None:
+    def test_download_callback_skips_tiny_steps(self, tmp_path: Any) -> None:
+        """Test download progress skips tiny steps and repeated completion."""
+        from pathlib import Path
+        from unittest.mock import MagicMock
+
+        from yt_audio_cli.cli import _download_audio
+        from yt_audio_cli.download import DownloadResult
+
+        mock_result = DownloadResult(
+            url="https://test.com",
+            success=True,
+            title="Test",
+            artist="Artist",
+            duration=120.0,
+            temp_path=Path(tmp_path) / "test.webm",
+            error=None,
+        )
+
+        mock_progress = MagicMock()
+        mock_progress.__enter__ = MagicMock(return_value=mock_progress)
+        mock_progress.__exit__ = MagicMock(return_value=False)
+        mock_progress.add_task = MagicMock(return_value=1)
+
+        captured_callback = None
+
+        def capture_callback(**kwargs: Any) -> DownloadResult:
+            nonlocal captured_callback
+            captured_callback = kwargs.get("progress_callback")
+            return mock_result
+
+        with (
+            patch("yt_audio_cli.cli.download", side_effect=capture_callback),
+            patch(
+                "yt_audio_cli.cli.create_download_progress",
+                return_value=mock_progress,
+            ),
+        ):
+            _download_audio("https://test.com", Path(tmp_path))
+
+            assert captured_callback is not None  # NOSONAR - modified by closure
+            captured_callback(10_000, 1_000_000)
+            captured_callback(10_500, 1_000_000)  # < 0.1% step, skipped
+            captured_callback(1_000_000, 1_000_000)  # completion always shown
+            captured_callback(1_000_500, 1_000_000)  # overshoot, clamped
+            captured_callback(1_200_000, 1_000_000)
+            assert mock_progress.update.call_count == 2
+            mock_progress.update.assert_called_with(
+                1, completed=1_000_000, total=1_000_000
+            )
+
+    def test_convert_callback_updates_progress(self, tmp_path: Any) -> None:
         """Test conversion progress callback updates task."""
         from pathlib import Path
         from unittest.mock import MagicMock
@@ -1373,7 +1423,7 @@ class TestProgressCallbacks:
         from yt_audio_cli.cli import _convert_audio
         from yt_audio_cli.download import DownloadResult
 
-        temp_file = Path(temp_dir) / "input.webm"
+        temp_file = Path(tmp_path) / "input.webm"
         temp_file.touch()
 
         result = DownloadResult(
@@ -1404,7 +1454,7 @@ class TestProgressCallbacks:
                 return_value=mock_progress,
             ),
         ):
-            _convert_audio(result, Path(temp_dir), "mp3", 320, True)
+            _convert_audio(result, Path(tmp_path), "mp3", 320, True)
 
             # Call the callback
             assert captured_callback is not None  # NOSONAR - modified by closure
@@ -1415,7 +1465,7 @@ class TestProgressCallbacks:
 class TestConvertAudioFileConflict:
     """Tests for _convert_audio() file conflict resolution."""
 
-    def test_resolves_file_conflict_when_output_exists(self, temp_dir: Any) -> None:
+    def test_resolves_file_conflict_when_output_exists(self, tmp_path: Any) -> None:
         """Test that file conflicts are resolved when output file already exists."""
         from pathlib import Path
         from unittest.mock import MagicMock
@@ -1424,11 +1474,11 @@ class TestConvertAudioFileConflict:
         from yt_audio_cli.download import DownloadResult
 
         # Create temp input file
-        temp_file = Path(temp_dir) / "input.webm"
+        temp_file = Path(tmp_path) / "input.webm"
         temp_file.touch()
 
         # Create existing output file (conflict)
-        existing_output = Path(temp_dir) / "Test_Song.mp3"
+        existing_output = Path(tmp_path) / "Test_Song.mp3"
         existing_output.touch()
 
         result = DownloadResult(
@@ -1459,7 +1509,7 @@ class TestConvertAudioFileConflict:
                 return_value=mock_progress,
             ),
         ):
-            output_path = _convert_audio(result, Path(temp_dir), "mp3", 320, True)
+            output_path = _convert_audio(result, Path(tmp_path), "mp3", 320, True)
 
             # Should resolve conflict by appending (1)
             assert output_path is not None
@@ -1470,7 +1520,7 @@ class TestConvertAudioFileConflict:
 class TestConvertAudioTempFileCleanup:
     """Tests for _convert_audio() temp file cleanup in finally block."""
 
-    def test_cleans_up_temp_file_on_error(self, temp_dir: Any) -> None:
+    def test_cleans_up_temp_file_on_error(self, tmp_path: Any) -> None:
         """Test that temp output file is cleaned up when transcode fails."""
         from pathlib import Path
         from unittest.mock import MagicMock
@@ -1478,7 +1528,7 @@ class TestConvertAudioTempFileCleanup:
         from yt_audio_cli.cli import _convert_audio
         from yt_audio_cli.download import DownloadResult
 
-        temp_file = Path(temp_dir) / "input.webm"
+        temp_file = Path(tmp_path) / "input.webm"
         temp_file.touch()
 
         result = DownloadResult(
@@ -1510,11 +1560,11 @@ class TestConvertAudioTempFileCleanup:
             ),
             patch("yt_audio_cli.cli.print_error"),
         ):
-            output_path = _convert_audio(result, Path(temp_dir), "mp3", 320, True)
+            output_path = _convert_audio(result, Path(tmp_path), "mp3", 320, True)
 
             assert output_path is None
             # Temp file in .converting dir should be cleaned up
-            converting_dir = Path(temp_dir) / ".converting"
+            converting_dir = Path(tmp_path) / ".converting"
             if converting_dir.exists():
                 temp_files = list(converting_dir.glob("*.mp3"))
                 assert len(temp_files) == 0
@@ -1579,14 +1629,14 @@ class TestBatchFileOption:
         return app
 
     def test_batch_file_loads_urls(
-        self, runner: CliRunner, cli_app: Any, temp_dir: Any
+        self, runner: CliRunner, cli_app: Any, tmp_path: Any
     ) -> None:
         """Test that URLs are loaded from batch file."""
         from pathlib import Path
 
         from yt_audio_cli.batch.request import BatchResult
 
-        batch_file = Path(temp_dir) / "urls.txt"
+        batch_file = Path(tmp_path) / "urls.txt"
         batch_file.write_text(
             "https://youtube.com/watch?v=test1\nhttps://youtube.com/watch?v=test2\n"
         )
@@ -1614,14 +1664,14 @@ class TestBatchFileOption:
             assert "Loaded 2 URL(s)" in result.output
 
     def test_batch_file_with_additional_urls(
-        self, runner: CliRunner, cli_app: Any, temp_dir: Any
+        self, runner: CliRunner, cli_app: Any, tmp_path: Any
     ) -> None:
         """Test that batch file URLs combine with positional URLs."""
         from pathlib import Path
 
         from yt_audio_cli.batch.request import BatchResult
 
-        batch_file = Path(temp_dir) / "urls.txt"
+        batch_file = Path(tmp_path) / "urls.txt"
         batch_file.write_text("https://youtube.com/watch?v=test1\n")
 
         with (
@@ -1664,12 +1714,12 @@ class TestBatchFileOption:
         assert "no urls" in result.output.lower()
 
     def test_batch_file_not_found(
-        self, runner: CliRunner, cli_app: Any, temp_dir: Any
+        self, runner: CliRunner, cli_app: Any, tmp_path: Any
     ) -> None:
         """Test error when batch file does not exist."""
         from pathlib import Path
 
-        missing_file = Path(temp_dir) / "nonexistent.txt"
+        missing_file = Path(tmp_path) / "nonexistent.txt"
 
         result = runner.invoke(
             cli_app,
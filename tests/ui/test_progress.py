@@ -268,6 +268,52 @@ class TestUpdateDownload:
             assert task.total == 1000
 
 
+class TestGetConsole:
+    """Tests for the lazily created shared console."""
+
+    def test_returns_same_instance(self) -> None:
+        """Test that the accessor and module attributes share one console."""
+        from yt_audio_cli import ui
+        from yt_audio_cli.ui.progress import console, get_console
+
+        assert get_console() is console
+        assert ui.console is console
+
+    def test_concurrent_first_use_creates_one_console(self) -> None:
+        """Test that threads racing on first use all get the same console."""
+        import threading
+
+        import pytest
+
+        from yt_audio_cli.ui import progress
+
+        barrier = threading.Barrier(8)
+        consoles = []
+
+        def worker() -> None:
+            barrier.wait()
+            consoles.append(progress.get_console())
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.delitem(vars(progress), "console", raising=False)
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert len({id(console) for console in consoles}) == 1
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that module __getattr__ only resolves ``console``."""
+        import pytest
+
+        from yt_audio_cli.ui import progress
+
+        with pytest.raises(AttributeError):
+            _ = progress.not_an_attribute
+
+
 class TestPrintFunctions:
     """Tests for print helper functions."""
 
@@ -322,3 +368,14 @@ class TestPrintFunctions:
             call_args = mock_console.print.call_args[0][0]
             assert "Processing item" in call_args
             assert "→" in call_args
+
+    def test_message_brackets_not_parsed_as_markup(self) -> None:
+        """Test square brackets in messages are printed literally."""
+        from unittest.mock import patch
+
+        from yt_audio_cli.ui.progress import print_success
+
+        with patch("yt_audio_cli.ui.progress.console") as mock_console:
+            print_success("Saved: Song [Official Video].mp3")
+            call_args = mock_console.print.call_args[0][0]
+            assert call_args.plain == "✓ Saved: Song [Official Video].mp3"